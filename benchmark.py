@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Scaling benchmark: run every day on growing synthetic inputs and compare to a baseline."""
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from generators import generate
+from main import discover_days, run_day
+
+
+# day -> (smallest size, number of sizes); sizes grow by --factor from there
+SIZES: dict[int, tuple[int, int]] = {
+    1: (20000, 4),
+    2: (500, 4),
+    3: (500, 4),
+    4: (10000, 4),
+    5: (1000, 4),
+    6: (500, 4),
+    7: (10000, 4),
+    8: (1024, 3),
+    9: (32, 3),
+    10: (50, 4),
+    11: (500, 4),
+    12: (500, 4),
+}
+
+# Smallest size a day's input can be: day 8 part 1 needs three circuits to be
+# left after 1000 connections
+MIN_SIZES: dict[int, int] = {
+    8: 79,
+}
+
+
+@dataclass
+class Sample:
+    size: int
+    parse: float
+    part1: float
+    part2: float
+
+    @property
+    def total(self) -> float:
+        return self.parse + self.part1 + self.part2
+
+
+@dataclass
+class DayBenchmark:
+    day: int
+    samples: list[Sample] = field(default_factory=list)
+    exponent: float = 0.0
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Slope of log(time) against log(size), i.e. k in time ~ size^k."""
+    if len(sizes) < 2:
+        return 0.0
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    return statistics.linear_regression(xs, ys).slope
+
+
+def benchmark_day(day: int, problem_path: Path, sizes: list[int], repeat: int, seed: int,
+                  workdir: Path) -> DayBenchmark:
+    bench = DayBenchmark(day)
+    for size in sizes:
+        input_path = workdir / f"day{day}-{size}.txt"
+        input_path.write_text(generate(day, size, seed))
+        best: Sample | None = None
+        for _ in range(repeat):
+            result = run_day(day, problem_path, input_path)
+            if result.error:
+                raise RuntimeError(f"day {day} failed at size {size}: {result.error}")
+            sample = Sample(size, result.parse_time, result.part1_time, result.part2_time)
+            if best is None or sample.total < best.total:
+                best = sample
+        input_path.unlink()
+        assert best is not None
+        bench.samples.append(best)
+        print(f"day {day:>2}  n={size:<8} {best.total * 1000:>10.1f}ms", file=sys.stderr)
+    bench.exponent = fit_exponent([s.size for s in bench.samples], [s.total for s in bench.samples])
+    return bench
+
+
+def to_json(benchmarks: list[DayBenchmark]) -> dict[str, object]:
+    return {
+        str(b.day): {
+            'exponent': b.exponent,
+            'samples': [dict(asdict(s), total=s.total) for s in b.samples],
+        }
+        for b in benchmarks
+    }
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict],
+            exponent_tolerance: float, time_ratio: float) -> list[str]:
+    """Describe every day that scales or runs worse than its baseline."""
+    regressions: list[str] = []
+    for day, current in results.items():
+        if day not in baseline:
+            continue
+        base = baseline[day]
+        if current['exponent'] > base['exponent'] + exponent_tolerance:
+            regressions.append(
+                f"day {day}: scaling exponent {current['exponent']:.2f} "
+                f"exceeds baseline {base['exponent']:.2f} + {exponent_tolerance}"
+            )
+        base_times = {s['size']: s['total'] for s in base['samples']}
+        for sample in current['samples']:
+            base_time = base_times.get(sample['size'])
+            if base_time and sample['total'] > base_time * time_ratio:
+                regressions.append(
+                    f"day {day}: n={sample['size']} took {sample['total'] * 1000:.1f}ms, "
+                    f"baseline {base_time * 1000:.1f}ms (limit {time_ratio}x)"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('days', nargs='*', type=int, help="days to benchmark (default: all)")
+    parser.add_argument('--factor', type=float, default=2.0, help="growth factor between sizes")
+    parser.add_argument('--scale', type=float, default=1.0, help="multiply every starting size")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per size, fastest is kept")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', type=Path, default=Path('benchmark-results.json'))
+    parser.add_argument('--baseline', type=Path, default=Path('benchmark-baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="write the results as the new baseline instead of comparing")
+    parser.add_argument('--exponent-tolerance', type=float, default=0.3)
+    parser.add_argument('--time-ratio', type=float, default=2.0)
+    args = parser.parse_args()
+
+    # Cache hits would replace every parse after the first repeat, and each
+    # synthetic input would leave a pickle behind
+    os.environ['AOC_PARSE_CACHE'] = '0'
+
+    available = discover_days()
+    selected = args.days or [d for d in available if d in SIZES]
+
+    benchmarks: list[DayBenchmark] = []
+    failures: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for day in selected:
+            start, steps = SIZES[day]
+            start = max(MIN_SIZES.get(day, 1), int(start * args.scale))
+            sizes = [int(start * args.factor ** k) for k in range(steps)]
+            try:
+                benchmarks.append(benchmark_day(day, available[day], sizes, args.repeat, args.seed, Path(tmp)))
+            except Exception as e:
+                # One broken day should not cost the measurements of the others
+                print(f"day {day:>2}  failed: {e}", file=sys.stderr)
+                failures.append(f"day {day}: {type(e).__name__}: {e}")
+
+    results = to_json(benchmarks)
+    args.output.write_text(json.dumps(results, indent=2) + '\n')
+    for b in benchmarks:
+        print(f"day {b.day:>2}: time ~ n^{b.exponent:.2f}")
+
+    if failures:
+        print("FAILURES:", file=sys.stderr)
+        for line in failures:
+            print(f"  {line}", file=sys.stderr)
+        if args.save_baseline:
+            print("Baseline not written", file=sys.stderr)
+        sys.exit(1)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    regressions = compare(results, json.loads(args.baseline.read_text()),
+                          args.exponent_tolerance, args.time_ratio)
+    if regressions:
+        print("REGRESSIONS:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        sys.exit(1)
+    print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
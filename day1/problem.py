@@ -1,5 +1,14 @@
 #!/usr/bin/env python3
+import random
 import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import iter_lines, mapped  # noqa: E402
 
 
 def count_zeros_left(start: int, distance: int) -> int:
@@ -18,18 +27,28 @@ def count_zeros_right(start: int, distance: int) -> int:
     return (distance - first_k) // 100 + 1
 
 
-def solve_part1(input_text: str) -> int:
+def parse_rotations(lines: Iterable[bytes]) -> list[int]:
+    """Parse rotation lines into signed distances, negative for L."""
+    rotations: list[int] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        distance = int(line[1:])
+        rotations.append(-distance if line[:1] == b'L' else distance)
+    return rotations
+
+
+def parse_input(filename: str) -> list[int]:
+    return parse_rotations(iter_lines(filename))
+
+
+def solve_part1(rotations: list[int]) -> int:
     position = 50
     count = 0
 
-    for line in input_text.strip().split('\n'):
-        direction = line[0]
-        distance = int(line[1:])
-
-        if direction == 'L':
-            position = (position - distance) % 100
-        else:
-            position = (position + distance) % 100
+    for rotation in rotations:
+        position = (position + rotation) % 100
 
         if position == 0:
             count += 1
@@ -37,34 +56,283 @@ def solve_part1(input_text: str) -> int:
     return count
 
 
-def solve_part2(input_text: str) -> int:
+def solve_part2(rotations: list[int]) -> int:
     position = 50
     count = 0
 
-    for line in input_text.strip().split('\n'):
-        direction = line[0]
-        distance = int(line[1:])
-
-        if direction == 'L':
-            count += count_zeros_left(position, distance)
-            position = (position - distance) % 100
+    for rotation in rotations:
+        if rotation < 0:
+            count += count_zeros_left(position, -rotation)
         else:
-            count += count_zeros_right(position, distance)
-            position = (position + distance) % 100
+            count += count_zeros_right(position, rotation)
+        position = (position + rotation) % 100
 
     return count
 
 
+def parse_input_array(filename: str) -> np.ndarray:
+    """Parse the rotation log straight from the mapped bytes into a signed int64 array."""
+    with mapped(filename) as data:
+        buf = np.frombuffer(data, dtype=np.uint8)
+        letters = np.flatnonzero((buf == ord('L')) | (buf == ord('R')))
+        non_digits = np.flatnonzero((buf < ord('0')) | (buf > ord('9')))
+        non_digits = np.append(non_digits, len(buf))
+        ends = non_digits[np.searchsorted(non_digits, letters, side='right')]
+        lengths = ends - letters - 1
+
+        distances = np.zeros(len(letters), dtype=np.int64)
+        for k in range(int(lengths.max(initial=0))):
+            has_digit = lengths > k
+            digits = buf[letters[has_digit] + 1 + k].astype(np.int64) - ord('0')
+            distances[has_digit] = distances[has_digit] * 10 + digits
+
+        negative = buf[letters] == ord('L')
+        del buf
+    return np.where(negative, -distances, distances)
+
+
+def solve_part1_vectorized(rotations: np.ndarray | list[int]) -> int:
+    """Part 1 over a whole rotation array at once."""
+    rotations = np.asarray(rotations, dtype=np.int64)
+    positions = (50 + np.cumsum(rotations)) % 100
+    return int(np.count_nonzero(positions == 0))
+
+
+def solve_part2_vectorized(rotations: np.ndarray | list[int]) -> int:
+    """Part 2 over a whole rotation array at once.
+
+    With the dial unwrapped to absolute positions, a right turn from a to b
+    passes b // 100 - a // 100 zeros and a left turn passes
+    (a - 1) // 100 - (b - 1) // 100.
+    """
+    rotations = np.asarray(rotations, dtype=np.int64)
+    if len(rotations) == 0:
+        return 0
+    after = 50 + np.cumsum(rotations)
+    before = np.empty_like(after)
+    before[0] = 50
+    before[1:] = after[:-1]
+
+    right = after // 100 - before // 100
+    left = (before - 1) // 100 - (after - 1) // 100
+    return int(np.where(rotations > 0, right, left).sum())
+
+
+# A dial transform is its net turn, which fixes where every start position
+# ends up, and an int64 array of the zeros passed from each start position
+Transform = tuple[int, np.ndarray]
+
+# Row t lists the positions 0..99 turned by t, for reading a transform's zeros
+# from where an earlier transform left each start position
+_TURNED = (np.arange(100) + np.arange(100)[:, None]) % 100
+
+
+def _frozen(zeros: np.ndarray) -> np.ndarray:
+    zeros.flags.writeable = False
+    return zeros
+
+
+IDENTITY: Transform = (0, _frozen(np.zeros(100, dtype=np.int64)))
+
+
+@lru_cache(maxsize=4096)
+def rotation_transform(rotation: int) -> Transform:
+    if rotation < 0:
+        zeros = [count_zeros_left(p, -rotation) for p in range(100)]
+    else:
+        zeros = [count_zeros_right(p, rotation) for p in range(100)]
+    # Shared by every childless node with this rotation, so kept read-only
+    return rotation % 100, _frozen(np.array(zeros, dtype=np.int64))
+
+
+def compose(first: Transform, second: Transform) -> Transform:
+    """Transform for applying first and then second."""
+    turn1, zeros1 = first
+    turn2, zeros2 = second
+    return (turn1 + turn2) % 100, zeros1 + zeros2[_TURNED[turn1]]
+
+
+class _Node:
+    __slots__ = ('rotation', 'priority', 'size', 'left', 'right', 'transform')
+
+    def __init__(self, rotation: int):
+        self.rotation = rotation
+        self.priority = random.random()
+        self.size = 1
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        self.transform = rotation_transform(rotation)
+
+    def update(self) -> None:
+        transform = rotation_transform(self.rotation)
+        size = 1
+        if self.left is not None:
+            transform = compose(self.left.transform, transform)
+            size += self.left.size
+        if self.right is not None:
+            transform = compose(transform, self.right.transform)
+            size += self.right.size
+        self.transform = transform
+        self.size = size
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _split(node: Optional[_Node], k: int) -> tuple[Optional[_Node], Optional[_Node]]:
+    """Split into the first k rotations and the rest."""
+    if node is None:
+        return None, None
+    if _size(node.left) < k:
+        node.right, rest = _split(node.right, k - _size(node.left) - 1)
+        node.update()
+        return node, rest
+    first, node.left = _split(node.left, k)
+    node.update()
+    return first, node
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        a.update()
+        return a
+    b.left = _merge(a, b.left)
+    b.update()
+    return b
+
+
+class DialIndex:
+    """Rotation log indexed by composed dial transforms.
+
+    Each node of an implicit treap stores its whole subtree's net turn and,
+    in one int64 array, the zeros it passes from each of the 100 start
+    positions; childless nodes share the cached single-rotation transform.
+    Edits, inserts and removals rebuild O(log n) transforms, and the root
+    answers part 2 for any start position without rescanning the log.
+    """
+
+    def __init__(self, rotations: Iterable[int] = ()):
+        self.root = self._build(rotations)
+
+    @staticmethod
+    def _build(rotations: Iterable[int]) -> Optional[_Node]:
+        # Cartesian tree on random priorities, then transforms bottom-up
+        spine: list[_Node] = []
+        for rotation in rotations:
+            node = _Node(rotation)
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        if not spine:
+            return None
+
+        root = spine[0]
+        order: list[_Node] = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        for node in reversed(order):
+            node.update()
+        return root
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def _check_index(self, index: int, upper: int) -> int:
+        if index < 0:
+            index += upper
+        if not 0 <= index < upper:
+            raise IndexError("rotation index out of range")
+        return index
+
+    def __getitem__(self, index: int) -> int:
+        index = self._check_index(index, len(self))
+        node = self.root
+        while node is not None:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.rotation
+            else:
+                index -= left + 1
+                node = node.right
+        raise IndexError("rotation index out of range")
+
+    def __setitem__(self, index: int, rotation: int) -> None:
+        index = self._check_index(index, len(self))
+        path: list[_Node] = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                node.rotation = rotation
+                break
+            else:
+                index -= left + 1
+                node = node.right
+        for node in reversed(path):
+            node.update()
+
+    def insert(self, index: int, rotation: int) -> None:
+        """Insert a rotation before position index (at the end if index == len)."""
+        index = self._check_index(index, len(self) + 1)
+        first, rest = _split(self.root, index)
+        self.root = _merge(_merge(first, _Node(rotation)), rest)
+
+    def append(self, rotation: int) -> None:
+        self.root = _merge(self.root, _Node(rotation))
+
+    def pop(self, index: int = -1) -> int:
+        index = self._check_index(index, len(self))
+        first, rest = _split(self.root, index)
+        removed, rest = _split(rest, 1)
+        self.root = _merge(first, rest)
+        assert removed is not None
+        return removed.rotation
+
+    def transform(self) -> Transform:
+        return self.root.transform if self.root is not None else IDENTITY
+
+    def zero_crossings(self, start: int = 50) -> int:
+        """Part 2 answer for the current log from the given start position."""
+        return int(self.transform()[1][start])
+
+    def final_position(self, start: int = 50) -> int:
+        return (start + self.transform()[0]) % 100
+
+    def zero_crossings_by_start(self) -> list[int]:
+        """Part 2 answer for every start position 0..99."""
+        return self.transform()[1].tolist()
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print("Usage: python problem.py <input_file>", file=sys.stderr)
         sys.exit(1)
 
-    with open(sys.argv[1], 'r') as f:
-        input_text = f.read()
+    rotations = parse_input(sys.argv[1])
 
-    print(solve_part1(input_text))
-    print(solve_part2(input_text))
+    print(solve_part1(rotations))
+    print(solve_part2(rotations))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(1, Path(__file__).with_name('problem.py'))
+from day1_problem import (  # noqa: E402
+    DialIndex,
+    parse_input,
+    parse_input_array,
+    solve_part1,
+    solve_part2,
+    solve_part1_vectorized,
+    solve_part2_vectorized,
+)
+
+
+EXAMPLE = """L68
+L30
+R48
+L5
+R60
+L55
+L1
+L99
+R14
+L82"""
+
+
+def parse_text(text: str) -> tuple[list[int], list[int]]:
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+        f.write(text)
+        f.flush()
+        rotations = parse_input(f.name)
+        array = parse_input_array(f.name).tolist()
+        os.unlink(f.name)
+    return rotations, array
+
+
+def test_example() -> None:
+    rotations, array = parse_text(EXAMPLE)
+    assert rotations == array
+    assert solve_part1(rotations) == 3
+    assert solve_part2(rotations) == 6
+
+
+def test_vectorized_example() -> None:
+    _, array = parse_text(EXAMPLE)
+    assert solve_part1_vectorized(array) == 3
+    assert solve_part2_vectorized(array) == 6
+
+
+def test_vectorized_matches_scalar() -> None:
+    rng = random.Random(1)
+    lines = [f"{rng.choice('LR')}{rng.randint(0, 1000)}" for _ in range(2000)]
+    rotations, array = parse_text('\n'.join(lines) + '\n')
+    assert rotations == array
+    assert solve_part1_vectorized(array) == solve_part1(rotations)
+    assert solve_part2_vectorized(array) == solve_part2(rotations)
+
+
+def test_dial_index_edits() -> None:
+    rng = random.Random(2)
+    rotations = [rng.randint(-500, 500) for _ in range(500)]
+    index = DialIndex(rotations)
+    assert index.zero_crossings() == solve_part2(rotations)
+    for _ in range(200):
+        op = rng.random()
+        value = rng.randint(-900, 900)
+        if op < 0.4:
+            i = rng.randrange(len(rotations))
+            rotations[i] = value
+            index[i] = value
+        elif op < 0.7:
+            i = rng.randint(0, len(rotations))
+            rotations.insert(i, value)
+            index.insert(i, value)
+        else:
+            i = rng.randrange(len(rotations))
+            assert index.pop(i) == rotations.pop(i)
+        assert index.zero_crossings() == solve_part2(rotations)
+    assert [index[i] for i in range(len(index))] == rotations
+
+
+def walk_dial(rotations: list[int], start: int) -> tuple[int, int]:
+    """Final position and zeros passed, turning the dial one click at a time."""
+    position, zeros = start, 0
+    for rotation in rotations:
+        step = 1 if rotation > 0 else -1
+        for _ in range(abs(rotation)):
+            position = (position + step) % 100
+            zeros += position == 0
+    return position, zeros
+
+
+def test_dial_index_every_start() -> None:
+    _, array = parse_text(EXAMPLE)
+    index = DialIndex(array)
+    assert index.zero_crossings(50) == 6
+    assert index.final_position() == 32
+
+    rng = random.Random(3)
+    rotations = [rng.randint(-250, 250) for _ in range(60)]
+    index = DialIndex(rotations)
+    for _ in range(20):
+        index.insert(rng.randint(0, len(index)), rotations[0])
+    rotations = [index[i] for i in range(len(index))]
+    by_start = index.zero_crossings_by_start()
+    for start in range(100):
+        position, zeros = walk_dial(rotations, start)
+        assert by_start[start] == index.zero_crossings(start) == zeros
+        assert index.final_position(start) == position
+    assert DialIndex().zero_crossings_by_start() == [0] * 100
+
+
+if __name__ == "__main__":
+    test_example()
+    test_vectorized_example()
+    test_vectorized_matches_scalar()
+    test_dial_index_edits()
+    test_dial_index_every_start()
+    print("All tests passed!")
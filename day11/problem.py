@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
 import sys
 from collections import defaultdict, deque
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import iter_lines  # noqa: E402
+from parse_cache import cached_parser  # noqa: E402
 
+
+@cached_parser(version=1)
 def parse_input(filename: str) -> dict[str, list[str]]:
     graph: dict[str, list[str]] = defaultdict(list)
-    with open(filename) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split(": ")
-            source = parts[0]
-            if len(parts) > 1:
-                destinations = parts[1].split()
-                graph[source] = destinations
+    for line in iter_lines(filename):
+        line = line.strip()
+        if not line:
+            continue
+        parts = line.decode().split(": ")
+        source = parts[0]
+        if len(parts) > 1:
+            destinations = parts[1].split()
+            graph[source] = destinations
     return graph
 
 
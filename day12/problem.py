@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import sys
+from pathlib import Path
 from typing import FrozenSet, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from parse_cache import cached_parser  # noqa: E402
+
 
 Shape = FrozenSet[Tuple[int, int]]
 
 
+@cached_parser(version=1)
 def parse_input(filename: str) -> tuple[dict[int, Shape], list[tuple[int, int, list[int]]]]:
     shapes: dict[int, Shape] = {}
     regions: list[tuple[int, int, list[int]]] = []
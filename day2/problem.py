@@ -1,5 +1,15 @@
 #!/usr/bin/env python3
+import re
+import struct
 import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import mapped  # noqa: E402
 
 
 def is_invalid_id(n: int) -> bool:
@@ -50,6 +60,31 @@ def generate_invalid_ids_in_range(start: int, end: int) -> list[int]:
     return invalid_ids
 
 
+def multiple_series(multiplier: int, x_min: int, x_max: int, start: int, end: int) -> tuple[int, int]:
+    """Count and sum of x * multiplier over x_min <= x <= x_max that land in [start, end]."""
+    x_start = max(x_min, (start + multiplier - 1) // multiplier)
+    x_end = min(x_max, end // multiplier)
+    if x_start > x_end:
+        return 0, 0
+    count = x_end - x_start + 1
+    return count, multiplier * (x_start + x_end) * count // 2
+
+
+def sum_invalid_ids_in_range(start: int, end: int) -> tuple[int, int]:
+    """Count and sum of invalid IDs in [start, end] as arithmetic series, one per half-length."""
+    count = 0
+    total = 0
+
+    n = 1
+    while 10**(n-1) * (10**n + 1) <= end:
+        c, t = multiple_series(10**n + 1, 10**(n-1), 10**n - 1, start, end)
+        count += c
+        total += t
+        n += 1
+
+    return count, total
+
+
 def solve_part1(input_text: str) -> int:
     """Find and sum all invalid IDs in the given ranges."""
     line = input_text.strip()
@@ -60,8 +95,7 @@ def solve_part1(input_text: str) -> int:
         parts = r.split('-')
         start = int(parts[0])
         end = int(parts[1])
-        invalid_ids = generate_invalid_ids_in_range(start, end)
-        total += sum(invalid_ids)
+        total += sum_invalid_ids_in_range(start, end)[1]
 
     return total
 
@@ -112,6 +146,54 @@ def generate_invalid_ids_part2_in_range(start: int, end: int) -> set[int]:
     return invalid_ids
 
 
+def divisors(n: int) -> list[int]:
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+
+def mobius(n: int) -> int:
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def sum_invalid_ids_part2_in_range(start: int, end: int) -> tuple[int, int]:
+    """Count and sum of IDs in [start, end] made of a pattern repeated at least twice.
+
+    For each digit length L, the IDs with period e (e dividing L) form one
+    arithmetic series. An ID with minimal period d also has every multiple of
+    d as a period, so Mobius inversion over the divisors of L recovers the
+    IDs of minimal period exactly d, and summing those over the proper
+    divisors counts each invalid ID once.
+    """
+    count = 0
+    total = 0
+
+    for length in range(2, len(str(end)) + 1):
+        if 10**length - 1 < start:
+            continue
+
+        by_period: dict[int, tuple[int, int]] = {}
+        for e in divisors(length)[:-1]:
+            multiplier = (10**length - 1) // (10**e - 1)
+            by_period[e] = multiple_series(multiplier, 10**(e-1), 10**e - 1, start, end)
+
+        for d in by_period:
+            for e, (c, t) in by_period.items():
+                if d % e == 0:
+                    sign = mobius(d // e)
+                    count += sign * c
+                    total += sign * t
+
+    return count, total
+
+
 def solve_part2(input_text: str) -> int:
     """Find and sum all invalid IDs (repeated at least twice) in the given ranges."""
     line = input_text.strip()
@@ -122,12 +204,86 @@ def solve_part2(input_text: str) -> int:
         parts = r.split('-')
         start = int(parts[0])
         end = int(parts[1])
-        invalid_ids = generate_invalid_ids_part2_in_range(start, end)
-        total += sum(invalid_ids)
+        total += sum_invalid_ids_part2_in_range(start, end)[1]
 
     return total
 
 
+def iter_ranges(input_text: str) -> Iterator[tuple[int, int]]:
+    """Lazily yield (start, end) for each comma-separated range."""
+    for match in re.finditer(r'(\d+)-(\d+)', input_text):
+        yield int(match.group(1)), int(match.group(2))
+
+
+class RepeatedIdTable:
+    """Sorted table of every invalid ID below 10**max_digits with prefix sums.
+
+    Any range inside the bound is answered with two bisects. The table is
+    built once and can be saved and reloaded instead of regenerated.
+    """
+
+    MAGIC = b'AOC2IDS1'
+    HEADER = struct.Struct('<8sBBQ')
+    # IDs are stored as unsigned 64-bit ints, which hold every 19-digit number
+    MAX_DIGITS = 19
+
+    def __init__(self, ids: array, max_digits: int, any_repeat: bool):
+        self.ids = ids
+        self.max_digits = max_digits
+        self.any_repeat = any_repeat
+        self.prefix = list(accumulate(ids, initial=0))
+
+    @classmethod
+    def build(cls, max_digits: int, any_repeat: bool = False) -> 'RepeatedIdTable':
+        """Part 1 table (pattern repeated exactly twice) or, with any_repeat, part 2."""
+        if not 1 <= max_digits <= cls.MAX_DIGITS:
+            raise ValueError(f"max_digits must be between 1 and {cls.MAX_DIGITS}, got {max_digits}")
+        ids = array('Q')
+        for length in range(2, max_digits + 1):
+            if any_repeat:
+                periods = divisors(length)[:-1]
+            elif length % 2 == 0:
+                periods = [length // 2]
+            else:
+                continue
+            found: set[int] = set()
+            for e in periods:
+                multiplier = (10**length - 1) // (10**e - 1)
+                found.update(x * multiplier for x in range(10**(e-1), 10**e))
+            ids.extend(sorted(found))
+        return cls(ids, max_digits, any_repeat)
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.max_digits, self.any_repeat, len(self.ids)))
+            self.ids.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> 'RepeatedIdTable':
+        with mapped(path) as data:
+            magic, max_digits, any_repeat, n = cls.HEADER.unpack_from(data)
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not a repeated-ID table")
+            ids = array('Q')
+            ids.frombytes(data[cls.HEADER.size:cls.HEADER.size + n * ids.itemsize])
+        return cls(ids, max_digits, bool(any_repeat))
+
+    def query(self, start: int, end: int) -> tuple[int, int]:
+        """Count and sum of table IDs in [start, end]."""
+        if end >= 10**self.max_digits:
+            raise ValueError(f"range end {end} exceeds table bound of {self.max_digits} digits")
+        lo = bisect_left(self.ids, start)
+        hi = bisect_right(self.ids, end)
+        return hi - lo, self.prefix[hi] - self.prefix[lo]
+
+    def query_stream(self, ranges: Iterable[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+        for start, end in ranges:
+            yield self.query(start, end)
+
+    def total(self, ranges: Iterable[tuple[int, int]]) -> int:
+        return sum(t for _, t in self.query_stream(ranges))
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print("Usage: python problem.py <input_file>", file=sys.stderr)
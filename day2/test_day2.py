@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(2, Path(__file__).with_name('problem.py'))
+from day2_problem import (  # noqa: E402
+    RepeatedIdTable,
+    generate_invalid_ids_in_range,
+    generate_invalid_ids_part2_in_range,
+    solve_part1,
+    solve_part2,
+    sum_invalid_ids_in_range,
+    sum_invalid_ids_part2_in_range,
+)
+
+
+EXAMPLE = (
+    "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,"
+    "1698522-1698528,446443-446449,38593856-38593862,565653-565659,"
+    "824824821-824824827,2121212118-2121212124"
+)
+
+
+def random_range(rng: random.Random) -> tuple[int, int]:
+    digits = rng.randint(1, 10)
+    start = rng.randint(1, 10 ** digits)
+    return start, start + rng.randint(0, 10 ** rng.randint(0, 7))
+
+
+def test_example() -> None:
+    assert solve_part1(EXAMPLE) == 1227775554
+    assert solve_part2(EXAMPLE) == 4174379265
+
+
+def test_series_matches_enumeration() -> None:
+    rng = random.Random(2)
+    for _ in range(2000):
+        start, end = random_range(rng)
+        ids = generate_invalid_ids_in_range(start, end)
+        assert sum_invalid_ids_in_range(start, end) == (len(ids), sum(ids))
+
+
+def test_mobius_inversion_matches_enumeration() -> None:
+    rng = random.Random(3)
+    for _ in range(2000):
+        start, end = random_range(rng)
+        ids = generate_invalid_ids_part2_in_range(start, end)
+        assert sum_invalid_ids_part2_in_range(start, end) == (len(ids), sum(ids)), (start, end)
+
+
+def test_mobius_inversion_composite_lengths() -> None:
+    # Lengths 4, 6, 8, 9, 10 and 12 have several proper periods that overlap
+    for length in (4, 6, 8, 9, 10, 12):
+        start, end = 10 ** (length - 1), 10 ** length - 1
+        ids = generate_invalid_ids_part2_in_range(start, end)
+        assert sum_invalid_ids_part2_in_range(start, end) == (len(ids), sum(ids))
+
+
+def test_repeated_id_table_round_trip() -> None:
+    rng = random.Random(4)
+    for any_repeat, reference in ((False, sum_invalid_ids_in_range),
+                                  (True, sum_invalid_ids_part2_in_range)):
+        table = RepeatedIdTable.build(7, any_repeat=any_repeat)
+        with tempfile.NamedTemporaryFile(suffix=".ids", delete=False) as f:
+            path = f.name
+        try:
+            table.save(path)
+            loaded = RepeatedIdTable.load(path)
+        finally:
+            os.unlink(path)
+        assert (loaded.max_digits, loaded.any_repeat) == (7, any_repeat)
+        assert list(loaded.ids) == list(table.ids)
+        for _ in range(500):
+            start = rng.randint(1, 10 ** 7 - 1)
+            end = rng.randint(start, 10 ** 7 - 1)
+            assert loaded.query(start, end) == reference(start, end)
+        ranges = [(11, 10 ** 7 - 1), (95, 115)]
+        assert loaded.total(ranges) == sum(reference(a, b)[1] for a, b in ranges)
+
+
+def test_repeated_id_table_bounds() -> None:
+    for max_digits in (0, -1, RepeatedIdTable.MAX_DIGITS + 1):
+        try:
+            RepeatedIdTable.build(max_digits)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"build({max_digits}) should fail")
+    assert len(RepeatedIdTable.build(1).ids) == 0
+
+    table = RepeatedIdTable.build(4)
+    assert table.query(9999, 9999) == (1, 9999)
+    try:
+        table.query(1, 10 ** 4)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("query past the table bound should fail")
+
+    with tempfile.NamedTemporaryFile(suffix=".ids", delete=False) as f:
+        f.write(b"not a table at all")
+        path = f.name
+    try:
+        RepeatedIdTable.load(path)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("loading a foreign file should fail")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    test_example()
+    test_series_matches_enumeration()
+    test_mobius_inversion_matches_enumeration()
+    test_mobius_inversion_composite_lengths()
+    test_repeated_id_table_round_trip()
+    test_repeated_id_table_bounds()
+    print("All tests passed!")
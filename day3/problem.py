@@ -2,6 +2,17 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import iter_lines, mapped  # noqa: E402
+from parse_cache import cached_parser  # noqa: E402
+
+
+@cached_parser(version=2)
+def parse_input(filename: str) -> list[str]:
+    return [line.strip().decode() for line in iter_lines(filename) if line.strip()]
+
 
 def max_joltage(bank: str) -> int:
     """Find maximum two-digit number from bank where first digit comes before second."""
@@ -33,24 +44,63 @@ def solve_part1(lines: list[str]) -> int:
 
 
 def max_joltage_k(bank: str, k: int) -> int:
-    """Find maximum k-digit number by selecting k digits in order."""
-    digits = [int(c) for c in bank]
-    n = len(digits)
-
-    result = []
-    pos = 0
-    for remaining in range(k, 0, -1):
-        end = n - remaining + 1
-        max_digit = -1
-        max_pos = -1
-        for i in range(pos, end):
-            if digits[i] > max_digit:
-                max_digit = digits[i]
-                max_pos = i
-        result.append(max_digit)
-        pos = max_pos + 1
-
-    return int(''.join(str(d) for d in result))
+    """Find maximum k-digit number by selecting k digits in order.
+
+    Monotonic stack: a digit evicts smaller digits before it while there
+    are still digits to spare, so the bank is scanned once.
+    """
+    to_drop = len(bank) - k
+    stack: list[str] = []
+    for c in bank:
+        while to_drop and stack and stack[-1] < c:
+            stack.pop()
+            to_drop -= 1
+        stack.append(c)
+
+    return int(''.join(stack[:k]))
+
+
+class DigitSparseTable:
+    """Range argmax over a bank's digits, leftmost on ties, in O(1) per query."""
+
+    def __init__(self, bank: str):
+        self.digits = digits = [int(c) for c in bank]
+        level = list(range(len(digits)))
+        self.levels = [level]
+        width = 1
+        while 2 * width <= len(digits):
+            prev = level
+            level = [
+                a if digits[a] >= digits[b] else b
+                for a, b in zip(prev, prev[width:])
+            ]
+            self.levels.append(level)
+            width *= 2
+
+    def argmax(self, lo: int, hi: int) -> int:
+        """Position of the leftmost largest digit in bank[lo:hi + 1]."""
+        j = (hi - lo + 1).bit_length() - 1
+        a = self.levels[j][lo]
+        b = self.levels[j][hi - (1 << j) + 1]
+        if self.digits[a] != self.digits[b]:
+            return a if self.digits[a] > self.digits[b] else b
+        return min(a, b)
+
+    def max_joltage_k(self, k: int) -> int:
+        n = len(self.digits)
+        value = 0
+        pos = 0
+        for remaining in range(k, 0, -1):
+            i = self.argmax(pos, n - remaining)
+            value = value * 10 + self.digits[i]
+            pos = i + 1
+        return value
+
+
+def max_joltages(bank: str, ks: list[int]) -> dict[int, int]:
+    """Maximum joltage for several k, sharing one sparse table over the bank."""
+    table = DigitSparseTable(bank)
+    return {k: table.max_joltage_k(k) for k in ks}
 
 
 def solve_part2(lines: list[str]) -> int:
@@ -62,16 +112,107 @@ def solve_part2(lines: list[str]) -> int:
     return total
 
 
+def load_bank_arrays(filename: str) -> dict[int, np.ndarray]:
+    """Load banks as uint8 digit arrays bucketed by bank length.
+
+    When every bank has the same length the mapped file is reshaped in
+    place before subtracting '0', so no per-line objects are ever created.
+    """
+    with mapped(filename) as data:
+        return split_banks(np.frombuffer(data, dtype=np.uint8))
+
+
+def split_banks(buf: np.ndarray) -> dict[int, np.ndarray]:
+    newlines = np.flatnonzero(buf == ord('\n'))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buf)]))
+    ends = ends - ((ends > starts) & (buf[np.maximum(ends - 1, 0)] == ord('\r')))
+    lengths = ends - starts
+    keep = lengths > 0
+    starts, lengths = starts[keep], lengths[keep]
+
+    banks: dict[int, np.ndarray] = {}
+    uniform = len(lengths) > 0 and (lengths == lengths[0]).all()
+    if uniform and (np.diff(starts) == lengths[0] + 1).all():
+        width = int(lengths[0])
+        rows = buf[starts[0]:starts[0] + len(starts) * (width + 1)]
+        if len(rows) < len(starts) * (width + 1):
+            rows = np.append(rows, ord('\n'))
+        banks[width] = rows.reshape(-1, width + 1)[:, :width] - ord('0')
+    else:
+        for width in np.unique(lengths):
+            row_starts = starts[lengths == width]
+            banks[int(width)] = buf[row_starts[:, None] + np.arange(width)] - ord('0')
+    return banks
+
+
+def bank_arrays(lines: list[str]) -> dict[int, np.ndarray]:
+    """Bucket text banks by length into uint8 digit arrays."""
+    by_length: dict[int, list[str]] = {}
+    for line in lines:
+        line = line.strip()
+        if line:
+            by_length.setdefault(len(line), []).append(line)
+    return {
+        width: np.frombuffer(''.join(group).encode(), dtype=np.uint8).reshape(-1, width) - ord('0')
+        for width, group in by_length.items()
+    }
+
+
+def batched_joltage(banks: np.ndarray, k: int) -> int:
+    """Sum of the maximum k-digit joltage of every row of an equal-length bank array."""
+    rows, width = banks.shape
+    if rows == 0:
+        return 0
+    if k == 2:
+        suffix_max = np.maximum.accumulate(banks[:, ::-1], axis=1)[:, ::-1]
+        values = banks[:, :-1].astype(np.int64) * 10 + suffix_max[:, 1:]
+        return int(values.max(axis=1).sum())
+
+    # Greedy pick per output digit, each a masked leftmost argmax over all rows
+    dtype = np.int64 if k <= 18 else object
+    values = np.zeros(rows, dtype=dtype)
+    pos = np.zeros(rows, dtype=np.int64)
+    cols = np.arange(width)
+    row_index = np.arange(rows)
+    for remaining in range(k, 0, -1):
+        window = banks[:, :width - remaining + 1]
+        masked = np.where(cols[:width - remaining + 1] >= pos[:, None], window + 1, 0)
+        chosen = masked.argmax(axis=1)
+        values = values * 10 + banks[row_index, chosen].astype(dtype)
+        pos = chosen + 1
+    # Each row fits in int64 but the total of many 18-digit rows may not
+    if dtype is not object and rows * 10 ** k > np.iinfo(np.int64).max:
+        return int(values.sum(dtype=object))
+    return int(values.sum())
+
+
+def solve_batched(banks_by_length: dict[int, np.ndarray], k: int) -> int:
+    return sum(batched_joltage(banks, k) for banks in banks_by_length.values())
+
+
+def solve_both(lines: list[str]) -> tuple[int, int]:
+    """Part 1 and part 2 totals with one preprocessing pass per bank."""
+    total1 = 0
+    total2 = 0
+    for line in lines:
+        if line.strip():
+            joltages = max_joltages(line.strip(), [2, 12])
+            total1 += joltages[2]
+            total2 += joltages[12]
+    return total1, total2
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print("Usage: python problem.py <input_file>")
         sys.exit(1)
 
-    input_path = Path(sys.argv[1])
-    lines = input_path.read_text().strip().split('\n')
+    lines = parse_input(sys.argv[1])
 
-    print(solve_part1(lines))
-    print(solve_part2(lines))
+    result1, result2 = solve_both(lines)
+    print(result1)
+    print(result2)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+import os
+import random
+import sys
+import tempfile
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(3, Path(__file__).with_name('problem.py'))
+from day3_problem import (  # noqa: E402
+    DigitSparseTable,
+    bank_arrays,
+    batched_joltage,
+    load_bank_arrays,
+    max_joltage,
+    max_joltage_k,
+    max_joltages,
+    parse_input,
+    solve_batched,
+    solve_both,
+    solve_part1,
+    solve_part2,
+)
+
+
+EXAMPLE = [
+    "987654321111111",
+    "811111111111119",
+    "234234234234278",
+    "818181911112111",
+]
+
+
+def random_bank(rng: random.Random, length: int) -> str:
+    # A narrow digit range makes ties, where the leftmost pick matters, common
+    low = rng.randint(1, 9)
+    return ''.join(str(rng.randint(low, 9)) for _ in range(length))
+
+
+def brute_force_joltage(bank: str, k: int) -> int:
+    return max(int(''.join(digits)) for digits in combinations(bank, k))
+
+
+def test_example() -> None:
+    assert solve_part1(EXAMPLE) == 357
+    assert solve_part2(EXAMPLE) == 3121910778619
+    assert solve_both(EXAMPLE) == (357, 3121910778619)
+
+
+def test_single_bank_matches_brute_force() -> None:
+    rng = random.Random(9)
+    for _ in range(500):
+        bank = random_bank(rng, rng.randint(2, 12))
+        table = DigitSparseTable(bank)
+        assert max_joltage(bank) == brute_force_joltage(bank, 2), bank
+        for k in range(1, len(bank) + 1):
+            expected = brute_force_joltage(bank, k)
+            assert max_joltage_k(bank, k) == expected, (bank, k)
+            assert table.max_joltage_k(k) == expected, (bank, k)
+
+
+def test_sparse_table_argmax() -> None:
+    rng = random.Random(10)
+    for _ in range(200):
+        bank = random_bank(rng, rng.randint(1, 40))
+        table = DigitSparseTable(bank)
+        lo = rng.randrange(len(bank))
+        hi = rng.randrange(lo, len(bank))
+        best = max(bank[lo:hi + 1])
+        assert table.argmax(lo, hi) == bank.index(best, lo), (bank, lo, hi)
+
+
+def test_batched_matches_single_bank() -> None:
+    rng = random.Random(11)
+    # Ragged lengths land in several buckets; k = 20 takes the object dtype path
+    banks = [random_bank(rng, rng.randint(20, 40)) for _ in range(200)]
+    by_length = bank_arrays(banks)
+    assert len(by_length) > 1
+    for k in (1, 2, 3, 12, 18, 19, 20):
+        assert solve_batched(by_length, k) == sum(max_joltage_k(bank, k) for bank in banks), k
+        assert max_joltages(banks[0], [k])[k] == max_joltage_k(banks[0], k)
+    assert batched_joltage(bank_arrays(["12"])[2][:0], 12) == 0
+
+
+def test_load_bank_arrays_line_endings() -> None:
+    rng = random.Random(12)
+    uniform = [random_bank(rng, 15) for _ in range(20)]
+    ragged = [random_bank(rng, rng.randint(15, 25)) for _ in range(20)]
+    cases = [
+        '\n'.join(uniform) + '\n',
+        '\n'.join(uniform),
+        '\r\n'.join(uniform) + '\r\n',
+        '\r\n'.join(uniform),
+        '\n' + '\n\n'.join(ragged),
+        '\r\n'.join(ragged),
+    ]
+    for text in cases:
+        banks = [line for line in text.split() if line]
+        with tempfile.NamedTemporaryFile('wb', suffix=".txt", delete=False) as f:
+            f.write(text.encode())
+            path = f.name
+        try:
+            by_length = load_bank_arrays(path)
+            assert parse_input.__wrapped__(path) == banks, repr(text)
+        finally:
+            os.unlink(path)
+        assert {w: a.tolist() for w, a in by_length.items()} == \
+            {w: a.tolist() for w, a in bank_arrays(banks).items()}, repr(text)
+        assert solve_batched(by_length, 12) == solve_part2(banks), repr(text)
+
+
+if __name__ == "__main__":
+    test_example()
+    test_single_bank_matches_brute_force()
+    test_sparse_table_argmax()
+    test_batched_matches_single_bank()
+    test_load_bank_arrays_line_endings()
+    print("All tests passed!")
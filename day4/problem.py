@@ -1,73 +1,225 @@
 #!/usr/bin/env python3
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
+from typing import Iterator
 
+import numpy as np
 
-def count_adjacent_rolls(grid: list[str], row: int, col: int) -> int:
-    """Count paper rolls (@) in the 8 adjacent positions."""
-    count = 0
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from parse_cache import cached_parser  # noqa: E402
 
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
-                continue
-            nr, nc = row + dr, col + dc
-            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == '@':
-                count += 1
-    return count
 
+@cached_parser(version=1)
+def parse_input(filename: str) -> list[str]:
+    return Path(filename).read_text().strip().split('\n')
 
-def solve_part1(grid: list[str]) -> int:
-    """Count rolls that can be accessed by forklift (fewer than 4 adjacent rolls)."""
-    count = 0
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            if grid[row][col] == '@':
-                adjacent = count_adjacent_rolls(grid, row, col)
-                if adjacent < 4:
-                    count += 1
-    return count
-
-
-def count_adjacent_rolls_mutable(grid: list[list[str]], row: int, col: int) -> int:
-    """Count paper rolls (@) in the 8 adjacent positions for mutable grid."""
-    count = 0
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
 
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
+def roll_array(grid: list[str]) -> np.ndarray:
+    """Grid as a uint8 array with 1 for each roll and a border of empty cells."""
+    rows = len(grid)
+    cols = max((len(row) for row in grid), default=0)
+    text = ''.join(row.ljust(cols, '.') for row in grid).encode()
+    rolls = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    if rows and cols:
+        rolls[1:-1, 1:-1] = np.frombuffer(text, dtype=np.uint8).reshape(rows, cols) == ord('@')
+    return rolls
+
+
+def neighbor_counts(rolls: np.ndarray) -> np.ndarray:
+    """Number of rolls among the 8 neighbors of every interior cell of a padded roll array."""
+    rows, cols = rolls.shape[0] - 2, rolls.shape[1] - 2
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
                 continue
-            nr, nc = row + dr, col + dc
-            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == '@':
-                count += 1
-    return count
+            counts += rolls[dr:dr + rows, dc:dc + cols]
+    return counts
 
 
-def solve_part2(grid: list[str]) -> int:
-    """Count total rolls that can be removed by repeatedly accessing and removing."""
-    mutable_grid = [list(row) for row in grid]
-    total_removed = 0
-
-    while True:
-        to_remove: list[tuple[int, int]] = []
-        for row in range(len(mutable_grid)):
-            for col in range(len(mutable_grid[row])):
-                if mutable_grid[row][col] == '@':
-                    adjacent = count_adjacent_rolls_mutable(mutable_grid, row, col)
-                    if adjacent < 4:
-                        to_remove.append((row, col))
+def accessible(rolls: np.ndarray) -> np.ndarray:
+    """Mask of interior rolls with fewer than 4 neighboring rolls."""
+    return (rolls[1:-1, 1:-1] == 1) & (neighbor_counts(rolls) < 4)
 
-        if not to_remove:
-            break
 
-        for row, col in to_remove:
-            mutable_grid[row][col] = '.'
+def solve_part1(grid: list[str]) -> int:
+    """Count rolls that can be accessed by forklift (fewer than 4 adjacent rolls)."""
+    return int(np.count_nonzero(accessible(roll_array(grid))))
+
+
+def peel_rounds(grid: list[str]) -> Iterator[list[tuple[int, int]]]:
+    """Yield the (row, col) of the rolls removed in each round, in round order.
+
+    Neighbor counts are computed once. Removing a roll only decrements its
+    neighbors, and a roll joins the next round exactly when its count drops
+    from 4 to 3, so the whole peel touches every cell a constant number of
+    times.
+    """
+    rolls = roll_array(grid)
+    width = rolls.shape[1]
+    counts = np.zeros_like(rolls)
+    counts[1:-1, 1:-1] = neighbor_counts(rolls)
+    frontier: list[int] = np.flatnonzero((rolls == 1) & (counts < 4)).tolist()
+
+    alive = bytearray(rolls.tobytes())
+    remaining = counts.ravel().tolist()
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+    while frontier:
+        for i in frontier:
+            alive[i] = 0
+        yield [(i // width - 1, i % width - 1) for i in frontier]
+
+        next_frontier: list[int] = []
+        for i in frontier:
+            for offset in offsets:
+                j = i + offset
+                if alive[j]:
+                    remaining[j] -= 1
+                    if remaining[j] == 3:
+                        next_frontier.append(j)
+        frontier = next_frontier
+
+
+def solve_part2(grid: list[str], workers: int = 1) -> int:
+    """Count total rolls that can be removed by repeatedly accessing and removing.
+
+    With workers > 1 the grid is peeled in row bands on a process pool.
+    """
+    if workers > 1:
+        return solve_part2_parallel(grid, workers)
+    return sum(len(removed) for removed in peel_rounds(grid))
+
+
+# Per worker process: the two shared round buffers, attached once
+_band_buffers: list[np.ndarray] = []
+_band_memory: list[SharedMemory] = []
+
+
+def _init_band_worker(names: tuple[str, str], shape: tuple[int, int]) -> None:
+    for name in names:
+        shm = SharedMemory(name=name)
+        _band_memory.append(shm)
+        _band_buffers.append(np.ndarray(shape, dtype=np.uint8, buffer=shm.buf))
+
+
+def _peel_band(src: int, lo: int, hi: int) -> int:
+    """Remove the accessible rolls of padded rows [lo, hi) from buffer src into the other buffer.
+
+    Rows lo - 1 and hi are the halo: they are read from the previous round's
+    buffer, which no worker writes during this round.
+    """
+    current = _band_buffers[src]
+    band = current[lo - 1:hi + 1]
+    interior = band[1:-1, 1:-1]
+    removable = (interior == 1) & (neighbor_counts(band) < 4)
+    _band_buffers[1 - src][lo:hi, 1:-1] = interior & ~removable
+    return int(np.count_nonzero(removable))
+
+
+def solve_part2_parallel(grid: list[str], workers: int | None = None, bands: int | None = None) -> int:
+    """Round-based peel split into row bands across a process pool.
+
+    The grid lives in two shared-memory buffers. Each round every band reads
+    its rows plus one-row halos from one buffer and writes its next state to
+    the other, so rounds are exact and the buffers swap roles afterwards.
+    """
+    rolls = roll_array(grid)
+    rows = rolls.shape[0] - 2
+    workers = workers or os.cpu_count() or 1
+    bands = max(1, min(bands or workers, rows))
+    bounds = [1 + rows * b // bands for b in range(bands + 1)]
+
+    memory = [SharedMemory(create=True, size=max(1, rolls.nbytes)) for _ in range(2)]
+    try:
+        for shm in memory:
+            np.ndarray(rolls.shape, dtype=np.uint8, buffer=shm.buf)[:] = rolls
+        total_removed = 0
+        src = 0
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_band_worker,
+            initargs=((memory[0].name, memory[1].name), rolls.shape),
+        ) as pool:
+            while True:
+                removed = sum(pool.map(_peel_band, [src] * bands, bounds[:-1], bounds[1:]))
+                if not removed:
+                    break
+                total_removed += removed
+                src = 1 - src
+        return total_removed
+    finally:
+        for shm in memory:
+            shm.close()
+            shm.unlink()
+
+
+def bitboard(grid: list[str]) -> tuple[list[int], int]:
+    """Each row as a big-int bitmask with bit c set for a roll in column c, plus the width."""
+    width = max((len(row) for row in grid), default=0)
+    to_bits = str.maketrans('@.', '10')
+    rows = [int(row[::-1].translate(to_bits) or '0', 2) for row in grid]
+    return rows, width
+
+
+def crowded(above: int, row: int, below: int, mask: int) -> int:
+    """Bits of row's columns that have at least 4 rolls among their 8 neighbors.
+
+    The eight neighbor masks are summed with bit-sliced full adders into a
+    4-bit counter per column; at least 4 means bit 2 or bit 3 is set.
+    """
+    b0 = b1 = b2 = b3 = 0
+    for v in (above << 1, above, above >> 1, row << 1, row >> 1, below << 1, below, below >> 1):
+        v &= mask
+        carry = b0 & v
+        b0 ^= v
+        v, carry = carry, b1 & carry
+        b1 ^= v
+        v, carry = carry, b2 & carry
+        b2 ^= v
+        b3 |= carry
+    return b2 | b3
+
+
+def accessible_rows(rows: list[int], width: int) -> list[int]:
+    """Per row, the mask of rolls with fewer than 4 neighboring rolls."""
+    mask = (1 << width) - 1
+    padded = [0] + rows + [0]
+    return [
+        row & ~crowded(padded[r], row, padded[r + 2], mask)
+        for r, row in enumerate(rows)
+    ]
+
+
+def solve_part1_bitboard(grid: list[str]) -> int:
+    rows, width = bitboard(grid)
+    return sum(m.bit_count() for m in accessible_rows(rows, width))
+
+
+def solve_part2_bitboard(grid: list[str]) -> int:
+    """Round-by-round peel on bitboard rows, re-evaluating only rows next to a removal."""
+    rows, width = bitboard(grid)
+    mask = (1 << width) - 1
+    padded = [0] + rows + [0]
+    total_removed = 0
 
-        total_removed += len(to_remove)
+    dirty = set(range(1, len(rows) + 1))
+    while dirty:
+        removals: dict[int, int] = {}
+        for r in dirty:
+            row = padded[r]
+            removable = row & ~crowded(padded[r - 1], row, padded[r + 1], mask)
+            if removable:
+                removals[r] = removable
+
+        dirty = set()
+        for r, removable in removals.items():
+            padded[r] &= ~removable
+            total_removed += removable.bit_count()
+            dirty.update(n for n in (r - 1, r, r + 1) if 1 <= n <= len(rows))
 
     return total_removed
 
@@ -77,8 +229,7 @@ def main() -> None:
         print("Usage: python problem.py <input_file>")
         sys.exit(1)
 
-    input_path = Path(sys.argv[1])
-    lines = input_path.read_text().strip().split('\n')
+    lines = parse_input(sys.argv[1])
 
     print(solve_part1(lines))
     print(solve_part2(lines))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(4, Path(__file__).with_name('problem.py'))
+from day4_problem import (  # noqa: E402
+    accessible,
+    accessible_rows,
+    bitboard,
+    peel_rounds,
+    roll_array,
+    solve_part1,
+    solve_part1_bitboard,
+    solve_part2,
+    solve_part2_bitboard,
+    solve_part2_parallel,
+)
+
+
+def random_grid(rng: random.Random, ragged: bool = False) -> list[str]:
+    rows = rng.randint(0, 12)
+    width = rng.randint(0, 70)
+    density = rng.random()
+    return [
+        ''.join('@' if rng.random() < density else '.'
+                for _ in range(rng.randint(0, width) if ragged else width))
+        for _ in range(rows)
+    ]
+
+
+def reference_rounds(grid: list[str]) -> list[list[tuple[int, int]]]:
+    """Remove every accessible roll at once until none is left, by brute force."""
+    rolls = {(r, c) for r, row in enumerate(grid) for c, ch in enumerate(row) if ch == '@'}
+    rounds = []
+    while True:
+        removable = sorted(
+            (r, c) for r, c in rolls
+            if sum((r + dr, c + dc) in rolls
+                   for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc) < 4
+        )
+        if not removable:
+            return rounds
+        rolls.difference_update(removable)
+        rounds.append(removable)
+
+
+def random_grids(seed: int):
+    rng = random.Random(seed)
+    for i in range(300):
+        yield random_grid(rng, ragged=i % 2 == 1)
+
+
+def test_full_square() -> None:
+    # Corners go first, then the edges they exposed, then the centre
+    grid = ["@@@", "@@@", "@@@"]
+    assert [len(removed) for removed in peel_rounds(grid)] == [4, 4, 1]
+    assert solve_part1(grid) == solve_part1_bitboard(grid) == 4
+    assert solve_part2(grid) == solve_part2_bitboard(grid) == 9
+
+
+def test_accessible_masks_agree() -> None:
+    for grid in random_grids(11):
+        mask = accessible(roll_array(grid))
+        rows, width = bitboard(grid)
+        bits = accessible_rows(rows, width)
+        for r in range(len(grid)):
+            assert [c for c in range(width) if bits[r] >> c & 1] == mask[r].nonzero()[0].tolist(), grid
+
+
+def test_engines_agree() -> None:
+    for grid in random_grids(12):
+        rounds = reference_rounds(grid)
+        assert [sorted(removed) for removed in peel_rounds(grid)] == rounds, grid
+        expected = sum(len(removed) for removed in rounds)
+        assert solve_part1(grid) == solve_part1_bitboard(grid) == (len(rounds[0]) if rounds else 0)
+        assert solve_part2(grid) == solve_part2_bitboard(grid) == expected, grid
+
+
+def test_parallel_bands_match_serial() -> None:
+    rng = random.Random(13)
+    for i in range(12):
+        grid = random_grid(rng, ragged=i % 2 == 1)
+        for bands in (1, 2, 3, len(grid) + 5):
+            assert solve_part2_parallel(grid, workers=2, bands=bands) == solve_part2(grid), (grid, bands)
+
+
+if __name__ == "__main__":
+    test_full_square()
+    test_accessible_masks_agree()
+    test_engines_agree()
+    test_parallel_bands_match_serial()
+    print("All tests passed!")
@@ -1,21 +1,30 @@
 #!/usr/bin/env python3
+import struct
 import sys
-from typing import TextIO
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterable, Iterator
 
+import numpy as np
 
-def parse_input(f: TextIO) -> tuple[list[tuple[int, int]], list[int]]:
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import iter_lines, mapped  # noqa: E402
+
+
+def parse_input(filename: str) -> tuple[list[tuple[int, int]], list[int]]:
     ranges: list[tuple[int, int]] = []
     ingredients: list[int] = []
 
     parsing_ranges = True
-    for line in f:
+    for line in iter_lines(filename):
         line = line.strip()
         if not line:
             parsing_ranges = False
             continue
 
         if parsing_ranges:
-            start, end = line.split("-")
+            start, end = line.split(b"-")
             ranges.append((int(start), int(end)))
         else:
             ingredients.append(int(line))
@@ -30,14 +39,6 @@ def is_fresh(ingredient_id: int, ranges: list[tuple[int, int]]) -> bool:
     return False
 
 
-def part1(ranges: list[tuple[int, int]], ingredients: list[int]) -> int:
-    count = 0
-    for ingredient in ingredients:
-        if is_fresh(ingredient, ranges):
-            count += 1
-    return count
-
-
 def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     if not ranges:
         return []
@@ -55,6 +56,53 @@ def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     return merged
 
 
+class IntervalIndex:
+    """Merged ranges as sorted start/end arrays for fast freshness queries."""
+
+    def __init__(self, ranges: list[tuple[int, int]]):
+        merged = merge_ranges(ranges)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+        self._arrays: tuple[np.ndarray, np.ndarray] | None = None
+
+    def contains(self, ingredient_id: int) -> bool:
+        i = bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+
+    def count_fresh(self, ingredients: Iterable[int]) -> int:
+        """Count fresh IDs with one bisect each."""
+        return sum(1 for ingredient in ingredients if self.contains(ingredient))
+
+    def count_fresh_sorted(self, ingredients: Iterable[int]) -> int:
+        """Count fresh IDs in a single sweep; ingredients must be in ascending order."""
+        count = 0
+        i = 0
+        n = len(self.starts)
+        for ingredient in ingredients:
+            while i < n and self.ends[i] < ingredient:
+                i += 1
+            if i == n:
+                break
+            if self.starts[i] <= ingredient:
+                count += 1
+        return count
+
+    def count_fresh_array(self, ingredients: np.ndarray) -> int:
+        """Count fresh IDs in an int64 array with one vectorized searchsorted."""
+        if self._arrays is None:
+            self._arrays = (np.array(self.starts, dtype=np.int64), np.array(self.ends, dtype=np.int64))
+        starts, ends = self._arrays
+        if len(starts) == 0:
+            return 0
+        i = np.searchsorted(starts, ingredients, side='right') - 1
+        fresh = (i >= 0) & (ingredients <= ends[np.maximum(i, 0)])
+        return int(np.count_nonzero(fresh))
+
+
+def part1(ranges: list[tuple[int, int]], ingredients: list[int]) -> int:
+    return IntervalIndex(ranges).count_fresh(ingredients)
+
+
 def part2(ranges: list[tuple[int, int]]) -> int:
     merged = merge_ranges(ranges)
     total = 0
@@ -63,13 +111,104 @@ def part2(ranges: list[tuple[int, int]]) -> int:
     return total
 
 
+class IntervalSet:
+    """Mutable set of integer IDs stored as sorted, disjoint, non-adjacent ranges.
+
+    Lookups are bisects. Insert and remove bisect to the affected ranges and
+    splice them in a single slice assignment. The covered count (part 2) is
+    kept up to date as ranges change.
+    """
+
+    MAGIC = b'AOC5SET1'
+    HEADER = struct.Struct('<8sQ')
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()):
+        merged = merge_ranges(list(ranges))
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._covered = sum(end - start + 1 for start, end in merged)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __contains__(self, ingredient_id: int) -> bool:
+        i = bisect_right(self._starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self._ends[i]
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    @property
+    def covered(self) -> int:
+        """Number of IDs in the set."""
+        return self._covered
+
+    def _span(self, lo: int, hi: int) -> int:
+        return sum(self._ends[k] - self._starts[k] + 1 for k in range(lo, hi))
+
+    def insert(self, start: int, end: int) -> None:
+        """Add every ID in [start, end], merging with overlapping or adjacent ranges."""
+        if start > end:
+            return
+        lo = bisect_left(self._ends, start - 1)
+        hi = bisect_right(self._starts, end + 1)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+            self._covered -= self._span(lo, hi)
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+        self._covered += end - start + 1
+
+    def remove(self, start: int, end: int) -> None:
+        """Drop every ID in [start, end], splitting ranges that straddle it."""
+        if start > end:
+            return
+        lo = bisect_left(self._ends, start)
+        hi = bisect_right(self._starts, end)
+        if lo >= hi:
+            return
+        new_starts: list[int] = []
+        new_ends: list[int] = []
+        if self._starts[lo] < start:
+            new_starts.append(self._starts[lo])
+            new_ends.append(start - 1)
+        if self._ends[hi - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self._ends[hi - 1])
+        self._covered -= self._span(lo, hi)
+        self._covered += sum(e - s + 1 for s, e in zip(new_starts, new_ends))
+        self._starts[lo:hi] = new_starts
+        self._ends[lo:hi] = new_ends
+
+    def save(self, path: str) -> None:
+        """Write a snapshot: header, then the starts and ends as int64 arrays."""
+        with open(path, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, len(self._starts)))
+            array('q', self._starts).tofile(f)
+            array('q', self._ends).tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> 'IntervalSet':
+        """Restore a snapshot written by save through a memory map."""
+        interval_set = cls()
+        with mapped(path) as data:
+            magic, n = cls.HEADER.unpack_from(data)
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not an interval set snapshot")
+            with data[cls.HEADER.size:cls.HEADER.size + 16 * n].cast('q') as values:
+                interval_set._starts = values[:n].tolist()
+                interval_set._ends = values[n:].tolist()
+        interval_set._covered = interval_set._span(0, n)
+        return interval_set
+
+
 def main() -> None:
     if len(sys.argv) != 2:
         print(f"Usage: {sys.argv[0]} <input_file>", file=sys.stderr)
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        ranges, ingredients = parse_input(f)
+    ranges, ingredients = parse_input(sys.argv[1])
 
     result1 = part1(ranges, ingredients)
     print(result1)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(5, Path(__file__).with_name('problem.py'))
+from day5_problem import (  # noqa: E402
+    IntervalIndex,
+    IntervalSet,
+    is_fresh,
+    parse_input,
+    part1,
+    part2,
+)
+
+
+def test_example() -> None:
+    example_data = """3-5
+10-14
+16-20
+12-18
+
+1
+5
+8
+11
+17
+32"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+        f.write(example_data)
+        f.flush()
+        ranges, ingredients = parse_input(f.name)
+        os.unlink(f.name)
+    assert part1(ranges, ingredients) == 3
+    assert part2(ranges) == 14
+
+
+def test_interval_index_modes() -> None:
+    rng = random.Random(5)
+    for _ in range(100):
+        ranges = []
+        for _ in range(rng.randint(0, 20)):
+            start = rng.randint(0, 200)
+            ranges.append((start, start + rng.randint(0, 30)))
+        # Range ends and their neighbours are where an off-by-one would show
+        edges = [x + d for start, end in ranges for x in (start, end) for d in (-1, 0, 1)]
+        ids = [rng.randint(-5, 260) for _ in range(100)] + edges
+        expected = sum(is_fresh(i, ranges) for i in ids)
+        index = IntervalIndex(ranges)
+        assert all(index.contains(i) == is_fresh(i, ranges) for i in ids)
+        assert index.count_fresh(ids) == expected
+        assert index.count_fresh_sorted(sorted(ids)) == expected
+        assert index.count_fresh_array(np.array(ids, dtype=np.int64)) == expected
+        assert index.count_fresh_array(np.array([], dtype=np.int64)) == 0
+        assert all(end + 1 < start for end, start in zip(index.ends, index.starts[1:]))
+
+
+def test_interval_set_updates() -> None:
+    rng = random.Random(6)
+    interval_set = IntervalSet()
+    members: set[int] = set()
+    for _ in range(500):
+        start = rng.randint(0, 300)
+        end = start + rng.randint(0, 25)
+        if rng.random() < 0.6:
+            interval_set.insert(start, end)
+            members.update(range(start, end + 1))
+        else:
+            interval_set.remove(start, end)
+            members.difference_update(range(start, end + 1))
+        assert interval_set.covered == len(members)
+    assert all((i in interval_set) == (i in members) for i in range(-5, 340))
+    ranges = list(interval_set)
+    assert all(a[1] + 1 < b[0] for a, b in zip(ranges, ranges[1:]))
+
+
+def test_interval_set_snapshot() -> None:
+    interval_set = IntervalSet([(3, 5), (10, 14), (16, 20), (12, 18)])
+    with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+        path = f.name
+    interval_set.save(path)
+    loaded = IntervalSet.load(path)
+    os.unlink(path)
+    assert list(loaded) == list(interval_set) == [(3, 5), (10, 20)]
+    assert loaded.covered == 14
+
+
+if __name__ == "__main__":
+    test_example()
+    test_interval_index_modes()
+    test_interval_set_updates()
+    test_interval_set_snapshot()
+    print("All tests passed!")
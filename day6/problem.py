@@ -1,102 +1,127 @@
 #!/usr/bin/env python3
 import sys
-from typing import TextIO
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
+import numpy as np
 
-def parse_input(f: TextIO) -> list[list[str]]:
-    lines = [line.rstrip('\n') for line in f]
-    max_len = max(len(line) for line in lines) if lines else 0
-    return [list(line.ljust(max_len)) for line in lines]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import iter_lines  # noqa: E402
 
 
-def is_blank_col(grid: list[list[str]], col: int) -> bool:
-    return all(grid[row][col] == ' ' for row in range(len(grid)))
+NON_DIGITS = bytes(b for b in range(256) if not ord('0') <= b <= ord('9'))
 
 
-def find_problems(grid: list[list[str]], vertical: bool = False) -> list[tuple[list[int], str]]:
-    if not grid:
+def parse_input(filename: str) -> np.ndarray:
+    """Worksheet as a 2D uint8 array of raw bytes, rows padded with spaces."""
+    lines = list(iter_lines(filename))
+    width = max((len(line) for line in lines), default=0)
+    data = b''.join(line.ljust(width) for line in lines)
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(lines), width)
+
+
+def problem_spans(sheet: np.ndarray) -> list[tuple[int, int]]:
+    """[start, end) column spans between all-blank separator columns."""
+    used = (sheet != ord(' ')).any(axis=0).astype(np.int8)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], used, [0]))))
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+
+
+def find_problems(sheet: np.ndarray, vertical: bool = False) -> list[tuple[list[int], str]]:
+    if sheet.size == 0:
         return []
 
-    height = len(grid)
-    width = len(grid[0])
-    op_row = height - 1
+    height = sheet.shape[0]
+    op_row = sheet[-1].tobytes()
+    rows = [sheet[row].tobytes() for row in range(height - 1)]
+    # Column c of the number rows is columns[c * (height - 1):(c + 1) * (height - 1)]
+    columns = np.ascontiguousarray(sheet[:-1].T).tobytes()
 
     problems: list[tuple[list[int], str]] = []
-
-    start_col = None
-    for col in range(width + 1):
-        if col == width or is_blank_col(grid, col):
-            if start_col is not None:
-                end_col = col - 1
-                op = ''
-                for c in range(start_col, end_col + 1):
-                    if grid[op_row][c] in '+*':
-                        op = grid[op_row][c]
-                        break
-
-                numbers: list[int] = []
-                if vertical:
-                    for c in range(start_col, end_col + 1):
-                        digits = ''
-                        for row in range(height - 1):
-                            if grid[row][c].isdigit():
-                                digits += grid[row][c]
-                        if digits:
-                            numbers.append(int(digits))
-                else:
-                    for row in range(height - 1):
-                        segment = ''.join(grid[row][start_col:end_col + 1]).strip()
-                        if segment and segment.isdigit():
-                            numbers.append(int(segment))
-
-                if numbers and op:
-                    problems.append((numbers, op))
-                start_col = None
+    for start, end in problem_spans(sheet):
+        ops = op_row[start:end]
+        positions = [i for i in (ops.find(b'+'), ops.find(b'*')) if i != -1]
+        op = chr(ops[min(positions)]) if positions else ''
+
+        numbers: list[int] = []
+        if vertical:
+            for c in range(start, end):
+                digits = columns[c * (height - 1):(c + 1) * (height - 1)].translate(None, NON_DIGITS)
+                if digits:
+                    numbers.append(int(digits))
         else:
-            if start_col is None:
-                start_col = col
+            for row in rows:
+                segment = row[start:end].strip()
+                if segment and segment.isdigit():
+                    numbers.append(int(segment))
+
+        if numbers and op:
+            problems.append((numbers, op))
 
     return problems
 
 
+def product_tree(numbers: list[int]) -> int:
+    """Product of numbers multiplied pairwise level by level.
+
+    Operands stay balanced in size, so big-integer multiplication does not
+    degrade to a long chain of growing-times-small products.
+    """
+    values = list(numbers)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
 def solve_problem(numbers: list[int], op: str) -> int:
     if op == '+':
         return sum(numbers)
     else:
-        result = 1
-        for n in numbers:
-            result *= n
-        return result
+        return product_tree(numbers)
 
 
-def part1(grid: list[list[str]]) -> int:
-    problems = find_problems(grid, vertical=False)
-    total = 0
-    for numbers, op in problems:
-        total += solve_problem(numbers, op)
-    return total
+def _solve_problem_tuple(problem: tuple[list[int], str]) -> int:
+    return solve_problem(*problem)
 
 
-def part2(grid: list[list[str]]) -> int:
-    problems = find_problems(grid, vertical=True)
-    total = 0
-    for numbers, op in problems:
-        total += solve_problem(numbers, op)
+def solve_problems(problems: list[tuple[list[int], str]], workers: int = 1) -> int:
+    """Total of all problems; with workers > 1 the products are reduced on a process pool."""
+    if workers <= 1:
+        return sum(solve_problem(numbers, op) for numbers, op in problems)
+
+    sums = [problem for problem in problems if problem[1] == '+']
+    products = [problem for problem in problems if problem[1] != '+']
+    total = sum(sum(numbers) for numbers, _ in sums)
+    chunksize = max(1, len(products) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        total += sum(pool.map(_solve_problem_tuple, products, chunksize=chunksize))
     return total
 
 
+def part1(sheet: np.ndarray, workers: int = 1) -> int:
+    return solve_problems(find_problems(sheet, vertical=False), workers)
+
+
+def part2(sheet: np.ndarray, workers: int = 1) -> int:
+    return solve_problems(find_problems(sheet, vertical=True), workers)
+
+
 def main() -> None:
     if len(sys.argv) != 2:
         print(f"Usage: {sys.argv[0]} <input_file>", file=sys.stderr)
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        grid = parse_input(f)
+    sheet = parse_input(sys.argv[1])
 
-    result1 = part1(grid)
+    result1 = part1(sheet)
     print(result1)
 
-    result2 = part2(grid)
+    result2 = part2(sheet)
     print(result2)
 
 
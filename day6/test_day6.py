@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import math
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(6, Path(__file__).with_name('problem.py'))
+from day6_problem import (  # noqa: E402
+    find_problems,
+    parse_input,
+    part1,
+    part2,
+    problem_spans,
+    product_tree,
+    solve_problems,
+)
+
+
+EXAMPLE = (
+    "123 328  51 64 \n"
+    " 45 64  387 23 \n"
+    "  6 98  215 314\n"
+    "*   +   *   +  \n"
+)
+
+
+def load(text: str):
+    with tempfile.NamedTemporaryFile('w', suffix=".txt", delete=False) as f:
+        f.write(text)
+        path = f.name
+    try:
+        return parse_input(path)
+    finally:
+        os.unlink(path)
+
+
+def test_example() -> None:
+    sheet = load(EXAMPLE)
+    assert problem_spans(sheet) == [(0, 3), (4, 7), (8, 11), (12, 15)]
+    assert find_problems(sheet) == [
+        ([123, 45, 6], '*'), ([328, 64, 98], '+'), ([51, 387, 215], '*'), ([64, 23, 314], '+'),
+    ]
+    assert find_problems(sheet, vertical=True) == [
+        ([1, 24, 356], '*'), ([369, 248, 8], '+'), ([32, 581, 175], '*'), ([623, 431, 4], '+'),
+    ]
+    assert part1(sheet) == 4277556
+    assert part2(sheet) == 3263827
+
+
+def test_ragged_lines() -> None:
+    # Trailing spaces trimmed and no final newline: rows are padded back to the widest
+    sheet = load("12  3\n 4 56\n+  *")
+    assert sheet.shape == (3, 5)
+    assert find_problems(sheet) == [([12, 4], '+'), ([3, 56], '*')]
+    assert find_problems(sheet, vertical=True) == [([1, 24], '+'), ([5, 36], '*')]
+    assert part1(load("")) == 0
+
+
+def test_product_tree() -> None:
+    rng = random.Random(6)
+    assert product_tree([]) == 1
+    for n in range(1, 40):
+        numbers = [rng.randint(0, 10 ** rng.randint(1, 30)) for _ in range(n)]
+        assert product_tree(numbers) == math.prod(numbers)
+
+
+def test_solve_problems_on_pool() -> None:
+    rng = random.Random(17)
+    problems = [
+        ([rng.randint(1, 9999) for _ in range(rng.randint(1, 6))], rng.choice('+*'))
+        for _ in range(200)
+    ]
+    expected = sum(sum(numbers) if op == '+' else math.prod(numbers) for numbers, op in problems)
+    assert solve_problems(problems) == expected
+    assert solve_problems(problems, workers=2) == expected
+    sheet = load(EXAMPLE)
+    assert part1(sheet, workers=2) == 4277556
+    assert part2(sheet, workers=2) == 3263827
+
+
+if __name__ == "__main__":
+    test_example()
+    test_ragged_lines()
+    test_product_tree()
+    test_solve_problems_on_pool()
+    print("All tests passed!")
@@ -1,32 +1,63 @@
 #!/usr/bin/env python3
 import sys
 from typing import TextIO
+from bisect import bisect_right
 from collections import deque
 
 
-def parse_input(f: TextIO) -> list[list[str]]:
-    return [list(line.rstrip('\n')) for line in f]
+def parse_input(f: TextIO) -> list[str]:
+    return [line.rstrip('\n') for line in f]
 
 
-def find_start(grid: list[list[str]]) -> tuple[int, int]:
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            if grid[row][col] == 'S':
-                return row, col
+def find_start(grid: list[str]) -> tuple[int, int]:
+    for row, line in enumerate(grid):
+        col = line.find('S')
+        if col != -1:
+            return row, col
     return -1, -1
 
 
-def part1(grid: list[list[str]]) -> int:
+class SplitterIndex:
+    """Splitter positions indexed both ways.
+
+    rows_by_column holds the sorted splitter rows of every column, so a beam
+    jumps straight to its next splitter. splitter_rows lists only the rows
+    that contain splitters, with their columns, so sweeps can skip empty rows.
+    """
+
+    def __init__(self, grid: list[str]):
+        self.height = len(grid)
+        self.width = len(grid[0]) if grid else 0
+        self.rows_by_column: list[list[int]] = [[] for _ in range(self.width)]
+        self.splitter_rows: list[tuple[int, list[int]]] = []
+        for row, line in enumerate(grid):
+            cols: list[int] = []
+            col = line.find('^')
+            while col != -1:
+                self.rows_by_column[col].append(row)
+                cols.append(col)
+                col = line.find('^', col + 1)
+            if cols:
+                self.splitter_rows.append((row, cols))
+
+    def next_splitter(self, row: int, col: int) -> int:
+        """Row of the first splitter below row in col, or -1 if the beam leaves the grid."""
+        rows = self.rows_by_column[col]
+        i = bisect_right(rows, row)
+        return rows[i] if i < len(rows) else -1
+
+
+def part1(grid: list[str]) -> int:
     if not grid:
         return 0
 
-    height = len(grid)
-    width = len(grid[0]) if grid else 0
-
     start_row, start_col = find_start(grid)
     if start_row == -1:
         return 0
 
+    index = SplitterIndex(grid)
+    width = index.width
+
     splits = 0
     beams: deque[tuple[int, int]] = deque()
     beams.append((start_row, start_col))
@@ -35,53 +66,60 @@ def part1(grid: list[list[str]]) -> int:
 
     while beams:
         row, col = beams.popleft()
+        if col < 0 or col >= width:
+            continue
 
-        while True:
-            row += 1
-
-            if row < 0 or row >= height or col < 0 or col >= width:
-                break
-
-            cell = grid[row][col]
-
-            if cell == '^':
-                if (row, col) not in visited_splitters:
-                    visited_splitters.add((row, col))
-                    splits += 1
-                    beams.append((row, col - 1))
-                    beams.append((row, col + 1))
-                break
+        row = index.next_splitter(row, col)
+        if row != -1 and (row, col) not in visited_splitters:
+            visited_splitters.add((row, col))
+            splits += 1
+            beams.append((row, col - 1))
+            beams.append((row, col + 1))
 
     return splits
 
 
-def part2(grid: list[list[str]]) -> int:
-    if not grid:
-        return 0
+def solve(grid: list[str]) -> tuple[int, int]:
+    """Part 1 and part 2 in one top-down sweep over the rows that hold splitters.
 
-    height = len(grid)
-    width = len(grid[0]) if grid else 0
+    Timeline counts live in one list with a padding column on each side and
+    are updated in place. A splitter is counted for part 1 when any timeline
+    reaches it. As in the row-by-row walk, a timeline split off the grid is
+    only dropped when a later row exists.
+    """
+    if not grid:
+        return 0, 0
 
     start_row, start_col = find_start(grid)
     if start_row == -1:
-        return 0
+        return 0, 0
 
-    col_counts: dict[int, int] = {start_col: 1}
+    index = SplitterIndex(grid)
+    width = index.width
+    last_row = index.height - 1
+
+    counts = [0] * (width + 2)
+    counts[start_col + 1] = 1
+    splits = 0
 
-    for row in range(start_row + 1, height):
-        new_counts: dict[int, int] = {}
-        for col, count in col_counts.items():
-            if col < 0 or col >= width:
-                continue
-            cell = grid[row][col]
-            if cell == '^':
-                new_counts[col - 1] = new_counts.get(col - 1, 0) + count
-                new_counts[col + 1] = new_counts.get(col + 1, 0) + count
-            else:
-                new_counts[col] = new_counts.get(col, 0) + count
-        col_counts = new_counts
+    for row, cols in index.splitter_rows:
+        if row <= start_row:
+            continue
+        hits = [(col, counts[col + 1]) for col in cols if counts[col + 1]]
+        for col, _ in hits:
+            counts[col + 1] = 0
+        for col, count in hits:
+            counts[col] += count
+            counts[col + 2] += count
+        splits += len(hits)
+        if row != last_row:
+            counts[0] = counts[width + 1] = 0
 
-    return sum(col_counts.values())
+    return splits, sum(counts)
+
+
+def part2(grid: list[str]) -> int:
+    return solve(grid)[1]
 
 
 def main() -> None:
@@ -92,10 +130,8 @@ def main() -> None:
     with open(sys.argv[1]) as f:
         grid = parse_input(f)
 
-    result1 = part1(grid)
+    result1, result2 = solve(grid)
     print(result1)
-
-    result2 = part2(grid)
     print(result2)
 
 
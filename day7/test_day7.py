@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+import io
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(7, Path(__file__).with_name('problem.py'))
+from day7_problem import SplitterIndex, parse_input, part1, part2, solve  # noqa: E402
+
+
+EXAMPLE = """\
+.......S.......
+...............
+.......^.......
+...............
+......^.^......
+...............
+.....^.^.^.....
+...............
+....^.^...^....
+...............
+...^.^...^.^...
+...............
+..^...^.....^..
+...............
+.^.^.^.^.^...^.
+...............
+"""
+
+
+def random_grid(rng: random.Random) -> list[str]:
+    height = rng.randint(1, 14)
+    width = rng.randint(1, 12)
+    density = rng.random() * 0.6
+    grid = [[('^' if rng.random() < density else '.') for _ in range(width)] for _ in range(height)]
+    grid[rng.randrange(height)][rng.randrange(width)] = 'S'
+    return [''.join(row) for row in grid]
+
+
+def reference_splits(grid: list[str]) -> int:
+    """Follow every beam down one cell at a time, counting each splitter reached once."""
+    height, width = len(grid), len(grid[0])
+    start = next((r, line.index('S')) for r, line in enumerate(grid) if 'S' in line)
+    beams = [start]
+    reached = set()
+    while beams:
+        row, col = beams.pop()
+        while 0 <= col < width and row + 1 < height:
+            row += 1
+            if grid[row][col] == '^':
+                if (row, col) not in reached:
+                    reached.add((row, col))
+                    beams += [(row, col - 1), (row, col + 1)]
+                break
+    return len(reached)
+
+
+def reference_timelines(grid: list[str]) -> int:
+    """Row-by-row timeline counts, dropping a timeline once it is off the grid on a later row."""
+    height, width = len(grid), len(grid[0])
+    start_row, start_col = next((r, line.index('S')) for r, line in enumerate(grid) if 'S' in line)
+    counts = {start_col: 1}
+    for row in range(start_row + 1, height):
+        new_counts: dict[int, int] = {}
+        for col, count in counts.items():
+            if not 0 <= col < width:
+                continue
+            targets = (col - 1, col + 1) if grid[row][col] == '^' else (col,)
+            for target in targets:
+                new_counts[target] = new_counts.get(target, 0) + count
+        counts = new_counts
+    return sum(counts.values())
+
+
+def test_example() -> None:
+    grid = parse_input(io.StringIO(EXAMPLE))
+    assert solve(grid) == (21, 40)
+    assert part1(grid) == 21
+    assert part2(grid) == 40
+
+
+def test_edge_splitters() -> None:
+    # Splitters in column 0, the last column and the last row send timelines off the grid
+    grid = [
+        "S..",
+        "^..",
+        "...",
+        ".^.",
+    ]
+    assert solve(grid) == (2, 2) == (reference_splits(grid), reference_timelines(grid))
+    grid = [
+        "..S",
+        "..^",
+        ".^.",
+        "...",
+        "^..",
+    ]
+    assert solve(grid) == (3, 3) == (reference_splits(grid), reference_timelines(grid))
+    assert solve(["S"]) == (0, 1)
+    assert solve(["...", "..."]) == (0, 0)
+
+
+def test_solve_matches_reference() -> None:
+    rng = random.Random(7)
+    for _ in range(2000):
+        grid = random_grid(rng)
+        expected = (reference_splits(grid), reference_timelines(grid))
+        assert solve(grid) == expected, grid
+        assert part1(grid) == expected[0], grid
+
+
+def test_splitter_index() -> None:
+    rng = random.Random(19)
+    for _ in range(200):
+        grid = random_grid(rng)
+        index = SplitterIndex(grid)
+        assert (index.height, index.width) == (len(grid), len(grid[0]))
+        assert index.splitter_rows == [
+            (r, [c for c, ch in enumerate(line) if ch == '^'])
+            for r, line in enumerate(grid) if '^' in line
+        ]
+        for row in range(-1, len(grid)):
+            for col in range(len(grid[0])):
+                below = [r for r in range(row + 1, len(grid)) if grid[r][col] == '^']
+                assert index.next_splitter(row, col) == (below[0] if below else -1)
+
+
+if __name__ == "__main__":
+    test_example()
+    test_edge_splitters()
+    test_solve_matches_reference()
+    test_splitter_index()
+    print("All tests passed!")
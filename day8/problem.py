@@ -1,49 +1,109 @@
 #!/usr/bin/env python3
+import bisect
+import heapq
+import math
 import sys
-from typing import TextIO
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from pathlib import Path
+from typing import Any, Collection, Iterable, Iterator
 
+import numpy as np
 
-def parse_input(f: TextIO) -> list[tuple[int, int, int]]:
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import iter_lines  # noqa: E402
+from parse_cache import cached_parser  # noqa: E402
+
+
+@cached_parser(version=1)
+def parse_input(filename: str) -> list[tuple[int, int, int]]:
     points: list[tuple[int, int, int]] = []
-    for line in f:
+    for line in iter_lines(filename):
         line = line.strip()
         if line:
-            x, y, z = map(int, line.split(','))
+            x, y, z = map(int, line.split(b','))
             points.append((x, y, z))
     return points
 
 
 class UnionFind:
-    def __init__(self, n: int):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.size = [1] * n
+    """Disjoint sets over 0..n-1 with union by size and path halving.
+
+    The sizes of the `top` largest components are kept up to date on every
+    union: a short sorted list holds them and a lazy max-heap holds every
+    other root, so top_sizes never rescans the forest.
+    """
+    __slots__ = ('parent', 'size', 'num_components', '_top_k', '_top', '_rest')
+
+    def __init__(self, n: int, top: int = 3):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
         self.num_components = n
+        self._top_k = top
+        # (size, root) of the largest roots, smallest first
+        self._top: list[tuple[int, int]] = [(1, r) for r in range(min(top, n))]
+        # (-size, root) of every other root; entries go stale once merged away
+        self._rest: list[tuple[int, int]] = [(-1, r) for r in range(min(top, n), n)]
 
     def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x: int, y: int) -> bool:
         px, py = self.find(x), self.find(y)
         if px == py:
             return False
-        if self.rank[px] < self.rank[py]:
+        size = self.size
+        if size[px] < size[py]:
             px, py = py, px
         self.parent[py] = px
-        self.size[px] += self.size[py]
-        if self.rank[px] == self.rank[py]:
-            self.rank[px] += 1
+        size[px] += size[py]
         self.num_components -= 1
+        self._update_top(px, py)
         return True
 
+    def union_many(self, xs: Iterable[int], ys: Iterable[int]) -> int:
+        """Union each xs[i] with ys[i] and return how many merged two sets."""
+        union = self.union
+        merged = 0
+        for x, y in zip(xs, ys):
+            if union(int(x), int(y)):
+                merged += 1
+        return merged
+
+    def _update_top(self, root: int, absorbed: int) -> None:
+        top = self._top
+        kept = [entry for entry in top if entry[1] != root and entry[1] != absorbed]
+        entry = (self.size[root], root)
+        if len(kept) < len(top) or len(kept) < self._top_k:
+            # Merging can only grow a component, so the new root outranks
+            # whatever it replaced in the list
+            bisect.insort(kept, entry)
+        elif entry > kept[0]:
+            heapq.heappush(self._rest, (-kept[0][0], kept[0][1]))
+            kept[0] = entry
+            kept.sort()
+        else:
+            heapq.heappush(self._rest, (-entry[0], root))
+
+        rest = self._rest
+        while len(kept) < self._top_k and rest:
+            neg_size, r = heapq.heappop(rest)
+            if self.parent[r] == r and self.size[r] == -neg_size:
+                bisect.insort(kept, (-neg_size, r))
+        self._top = kept
+
+    def top_sizes(self) -> list[int]:
+        """Sizes of the largest components, largest first."""
+        return [size for size, _ in reversed(self._top)]
+
     def get_component_sizes(self) -> list[int]:
-        sizes: list[int] = []
-        for i in range(len(self.parent)):
-            if self.find(i) == i:
-                sizes.append(self.size[i])
-        return sizes
+        parent, size = self.parent, self.size
+        return [size[i] for i in range(len(parent)) if parent[i] == i]
 
 
 def euclidean_distance_sq(p1: tuple[int, int, int], p2: tuple[int, int, int]) -> int:
@@ -61,33 +121,803 @@ def get_all_pairs_sorted(points: list[tuple[int, int, int]]) -> list[tuple[int,
     return pairs
 
 
+# Per worker process: the coordinate columns, set once by the pool initializer
+_pair_coords: list[np.ndarray] = []
+
+_NO_PAIR = np.iinfo(np.int64).max
+
+
+def _init_pair_worker(coords: np.ndarray) -> None:
+    _pair_coords[:] = [np.ascontiguousarray(coords[:, axis]) for axis in range(3)]
+
+
+def _smallest_in_tile(
+    a: int, b: int, tile: int, k: int, bound: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The k smallest (dist_sq, i, j) with i < j, i in [a, a+tile) and j in [b, b+tile).
+
+    Only pairs at most bound apart are considered when it is given.
+    """
+    dist: np.ndarray | None = None
+    for column in _pair_coords:
+        diff = column[a:a + tile, None] - column[None, b:b + tile]
+        if dist is None:
+            dist = diff * diff
+        else:
+            dist += diff * diff
+    assert dist is not None
+
+    if a == b:
+        # Pairs with j <= i in the diagonal block sort after every real one
+        dist[np.tril_indices_from(dist)] = _NO_PAIR
+    flat = dist.ravel()
+    limit = _NO_PAIR - 1 if bound is None else bound
+    close = np.flatnonzero(flat <= limit)
+    if len(close) > k:
+        # Every pair tied with the k-th distance survives, so the (i, j)
+        # tie-break below still sees all of them
+        kth = np.partition(flat[close], k - 1)[k - 1]
+        close = close[flat[close] <= kth]
+    rows, cols = np.divmod(close, dist.shape[1])
+    d = flat[close]
+    i = rows + a
+    j = cols + b
+    order = np.lexsort((j, i, d))[:k]
+    return d[order], i[order], j[order]
+
+
+def _merge_smallest(
+    best: tuple[np.ndarray, np.ndarray, np.ndarray],
+    found: tuple[np.ndarray, np.ndarray, np.ndarray],
+    k: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    d, i, j = (np.concatenate(pair) for pair in zip(best, found))
+    order = np.lexsort((j, i, d))[:k]
+    return d[order], i[order], j[order]
+
+
+def smallest_pairs_blocked(
+    points: list[tuple[int, int, int]], k: int, tile: int = 512, workers: int = 1
+) -> list[tuple[int, int, int]]:
+    """The same list as get_all_pairs_sorted(points)[:k], computed tile by tile.
+
+    Squared distances are evaluated with NumPy over tile x tile blocks of the
+    upper triangle, and each block contributes only its k smallest pairs to a
+    running candidate set, so memory stays O(tile^2 + k) for any n. Run
+    serially, the running k-th distance also prunes later blocks; with
+    workers > 1 the blocks are spread over a process pool.
+    """
+    n = len(points)
+    if n < 2 or k <= 0:
+        return []
+
+    coords = np.array(points, dtype=np.int64).reshape(n, 3)
+    starts = range(0, n, tile)
+    blocks = [(a, b) for a in starts for b in starts if b >= a]
+    empty = np.empty(0, dtype=np.int64)
+    best = (empty, empty, empty)
+
+    if workers <= 1:
+        _init_pair_worker(coords)
+        try:
+            for a, b in blocks:
+                bound = int(best[0][-1]) if len(best[0]) == k else None
+                best = _merge_smallest(best, _smallest_in_tile(a, b, tile, k, bound), k)
+        finally:
+            _pair_coords.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_pair_worker, initargs=(coords,)
+        ) as pool:
+            found = pool.map(
+                _smallest_in_tile,
+                [a for a, _ in blocks],
+                [b for _, b in blocks],
+                [tile] * len(blocks),
+                [k] * len(blocks),
+            )
+            for candidates in found:
+                best = _merge_smallest(best, candidates, k)
+
+    return list(zip(best[0].tolist(), best[1].tolist(), best[2].tolist()))
+
+
+def build_grid(points: list[tuple[int, int, int]], cell: float) -> dict[tuple[int, int, int], list[int]]:
+    """Uniform spatial hash: cell coordinates to the ascending indices of the points inside."""
+    grid: dict[tuple[int, int, int], list[int]] = {}
+    for i, (x, y, z) in enumerate(points):
+        grid.setdefault((int(x // cell), int(y // cell), int(z // cell)), []).append(i)
+    return grid
+
+
+def pairs_within(points: list[tuple[int, int, int]], radius: float) -> Iterator[tuple[int, int, int]]:
+    """Yield (dist_sq, i, j) with i < j for every pair no farther apart than radius."""
+    limit = radius * radius
+    grid = build_grid(points, radius)
+    neighbors = list(product((-1, 0, 1), repeat=3))
+    for (cx, cy, cz), members in grid.items():
+        for dx, dy, dz in neighbors:
+            others = grid.get((cx + dx, cy + dy, cz + dz))
+            if others is None:
+                continue
+            for i in members:
+                p = points[i]
+                for j in others:
+                    if j <= i:
+                        continue
+                    dist_sq = euclidean_distance_sq(p, points[j])
+                    if dist_sq <= limit:
+                        yield dist_sq, i, j
+
+
+def closest_pairs(points: list[tuple[int, int, int]], k: int) -> list[tuple[int, int, int]]:
+    """The k smallest (dist_sq, i, j) pairs, equal to get_all_pairs_sorted(points)[:k].
+
+    Pairs are enumerated through a uniform grid only within a radius sized
+    so that about k pairs are expected inside it, and the radius doubles
+    until at least k pairs are found. A bounded heap keeps the k best, so
+    memory stays O(n + k). Every pair at the k-th distance lies inside the
+    radius, so ties come out in the same (dist_sq, i, j) order as a full sort.
+    """
+    n = len(points)
+    k = min(k, n * (n - 1) // 2)
+    if k <= 0:
+        return []
+
+    volume = 1.0
+    for axis in range(3):
+        values = [p[axis] for p in points]
+        volume *= max(max(values) - min(values), 1)
+    radius = max(1.0, 1.5 * (3 * k * volume / (2 * math.pi * n * n)) ** (1 / 3))
+
+    while True:
+        # Max-heap of the k best so far, as negated keys
+        heap: list[tuple[int, int, int]] = []
+        found = 0
+        for dist_sq, i, j in pairs_within(points, radius):
+            found += 1
+            key = (-dist_sq, -i, -j)
+            if len(heap) < k:
+                heapq.heappush(heap, key)
+            elif key > heap[0]:
+                heapq.heapreplace(heap, key)
+        if found >= k:
+            return sorted((-d, -i, -j) for d, i, j in heap)
+        radius *= 2
+
+
 def part1(points: list[tuple[int, int, int]]) -> int:
     n = len(points)
     uf = UnionFind(n)
 
-    pairs = get_all_pairs_sorted(points)
+    pairs = closest_pairs(points, 1000)
+    uf.union_many([i for _, i, _ in pairs], [j for _, _, j in pairs])
 
-    for _, i, j in pairs[:1000]:
-        uf.union(i, j)
-
-    sizes = uf.get_component_sizes()
-    sizes.sort(reverse=True)
+    sizes = uf.top_sizes()
 
     return sizes[0] * sizes[1] * sizes[2]
 
 
-def part2(points: list[tuple[int, int, int]]) -> int:
+def euclidean_mst(
+    points: list[tuple[int, int, int]], return_tree: bool = False
+) -> tuple[tuple[int, int, int] | None, list[tuple[int, int, int]]]:
+    """Minimum spanning tree by dense Prim, without storing any pair list.
+
+    Edges are ordered by (dist_sq, i, j) with i < j, the order
+    get_all_pairs_sorted uses, which makes the tree unique. Its largest edge
+    is then exactly the edge whose union connects everything in Kruskal.
+    Each step updates an O(n) array of best distances to the tree with NumPy.
+
+    Returns that connecting edge as (dist_sq, i, j), or None for fewer than
+    two points, and the tree edges in the order they were added if
+    return_tree is set.
+    """
     n = len(points)
-    uf = UnionFind(n)
+    if n < 2:
+        return None, []
+
+    coords = np.array(points, dtype=np.int64)
+    # Vertices outside the tree occupy the first `remaining` slots of these
+    # arrays; a vertex joining the tree is swapped with the last of them.
+    xs, ys, zs = (np.ascontiguousarray(coords[:, axis]) for axis in range(3))
+    outside = np.arange(n, dtype=np.int64)
+    best_dist = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    best_from = np.zeros(n, dtype=np.int64)
+    columns = (xs, ys, zs, outside, best_dist, best_from)
+
+    tree: list[tuple[int, int, int]] = []
+    longest: tuple[int, int, int] | None = None
+    remaining = n - 1
+    u = n - 1
+    ux, uy, uz = points[u]
+
+    while remaining:
+        vs = outside[:remaining]
+        dist = best_dist[:remaining]
+        source = best_from[:remaining]
+
+        dx = xs[:remaining] - ux
+        dy = ys[:remaining] - uy
+        dz = zs[:remaining] - uz
+        new_dist = dx * dx
+        new_dist += dy * dy
+        new_dist += dz * dz
+
+        better = new_dist < dist
+        tied = np.flatnonzero(new_dist == dist)
+        if len(tied):
+            v = vs[tied]
+            old = np.minimum(source[tied], v), np.maximum(source[tied], v)
+            new = np.minimum(u, v), np.maximum(u, v)
+            better[tied] = (new[0] < old[0]) | ((new[0] == old[0]) & (new[1] < old[1]))
+        dist[better] = new_dist[better]
+        source[better] = u
+
+        slot = int(dist.argmin())
+        shortest = int(dist[slot])
+        v, a = int(vs[slot]), int(source[slot])
+        edge = (shortest, min(a, v), max(a, v))
+        for other in np.flatnonzero(dist == shortest).tolist():
+            v2, a2 = int(vs[other]), int(source[other])
+            candidate = (shortest, min(a2, v2), max(a2, v2))
+            if candidate < edge:
+                slot, v, edge = other, v2, candidate
+
+        if return_tree:
+            tree.append(edge)
+        if longest is None or edge > longest:
+            longest = edge
+
+        last = remaining - 1
+        for column in columns:
+            column[slot], column[last] = column[last], column[slot]
+        remaining = last
+        u = v
+        ux, uy, uz = points[u]
+
+    return longest, tree
+
+
+def part2(points: list[tuple[int, int, int]]) -> int:
+    connecting, _ = euclidean_mst(points)
+    if connecting is None:
+        return 0
+    _, i, j = connecting
+    return points[i][0] * points[j][0]
+
+
+class LinkCutTree:
+    """Forest under link and cut with path-maximum queries, by splay trees.
+
+    Nodes hold comparable values. Each preferred path is a splay tree that
+    tracks the node with the largest value below it, so link, cut and
+    path_max are O(log n) amortized. Freed nodes are reused by add.
+    """
+    __slots__ = ('value', 'left', 'right', 'parent', 'flipped', 'best', '_free')
+
+    def __init__(self) -> None:
+        self.value: list[Any] = []
+        # -1 marks a missing child or parent
+        self.left: list[int] = []
+        self.right: list[int] = []
+        self.parent: list[int] = []
+        self.flipped: list[bool] = []
+        # Node with the largest value in each splay subtree
+        self.best: list[int] = []
+        self._free: list[int] = []
+
+    def add(self, value: Any) -> int:
+        """Create an isolated node holding value and return it."""
+        if self._free:
+            x = self._free.pop()
+            self.value[x] = value
+            self.left[x] = self.right[x] = self.parent[x] = -1
+            self.flipped[x] = False
+            self.best[x] = x
+            return x
+        x = len(self.value)
+        self.value.append(value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flipped.append(False)
+        self.best.append(x)
+        return x
+
+    def discard(self, x: int) -> None:
+        """Release a node that has been cut from everything."""
+        self._free.append(x)
+
+    def link(self, x: int, y: int) -> None:
+        """Join the trees of x and y, which must differ, by the edge x-y."""
+        self._make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x: int, y: int) -> None:
+        """Remove the existing edge x-y."""
+        self._make_root(x)
+        self._access(y)
+        # The path is just x then y, so x is y's whole left subtree
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+    def path_max(self, x: int, y: int) -> int:
+        """The node with the largest value on the path between connected x and y."""
+        self._make_root(x)
+        self._access(y)
+        return self.best[y]
+
+    def _is_splay_root(self, x: int) -> bool:
+        p = self.parent[x]
+        return p < 0 or (self.left[p] != x and self.right[p] != x)
+
+    def _pull(self, x: int) -> None:
+        value, best = self.value, self.best
+        top = x
+        for child in (self.left[x], self.right[x]):
+            if child >= 0 and value[best[child]] > value[top]:
+                top = best[child]
+        best[x] = top
+
+    def _push(self, x: int) -> None:
+        if self.flipped[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left >= 0:
+                self.flipped[left] = not self.flipped[left]
+            if right >= 0:
+                self.flipped[right] = not self.flipped[right]
+            self.flipped[x] = False
+
+    def _rotate(self, x: int) -> None:
+        parent, left, right = self.parent, self.left, self.right
+        p = parent[x]
+        g = parent[p]
+        if not self._is_splay_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            moved = right[x]
+            left[p] = moved
+            right[x] = p
+        else:
+            moved = left[x]
+            right[p] = moved
+            left[x] = p
+        if moved >= 0:
+            parent[moved] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x: int) -> None:
+        path = [x]
+        while not self._is_splay_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for y in reversed(path):
+            self._push(y)
+        left = self.left
+        while not self._is_splay_root(x):
+            p = self.parent[x]
+            if not self._is_splay_root(p):
+                g = self.parent[p]
+                self._rotate(p if (left[g] == p) == (left[p] == x) else x)
+            self._rotate(x)
+
+    def _access(self, x: int) -> None:
+        last = -1
+        y = x
+        while y >= 0:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x: int) -> None:
+        self._access(x)
+        self.flipped[x] = not self.flipped[x]
+
+
+# Yao cones around a box: the 6 faces of a cube, each split 2 x 2 by the
+# signs of the two minor offsets. Every cone is at most 60 degrees wide.
+_CONES = 24
+_MINOR_AXES = ((1, 2), (0, 2), (0, 1))
+_OCTANTS = tuple(product((0, 1), repeat=3))
+
+
+def _cone_of(offset: tuple[int, int, int]) -> int:
+    """The cone containing a non-zero offset."""
+    axis = 0
+    for other in (1, 2):
+        if abs(offset[other]) > abs(offset[axis]):
+            axis = other
+    a, b = _MINOR_AXES[axis]
+    return (2 * axis + (offset[axis] < 0)) * 4 + 2 * (offset[a] >= 0) + (offset[b] >= 0)
+
+
+def _halves_meeting(t_lo: int, t_hi: int, d_hi: int) -> list[int]:
+    """Halves (0 negative, 1 non-negative) that a minor offset in [t_lo, t_hi] can reach within |t| <= d_hi."""
+    halves: list[int] = []
+    if t_hi >= -d_hi and t_lo <= 0:
+        halves.append(0)
+    if t_hi >= 0 and t_lo <= d_hi:
+        halves.append(1)
+    return halves
+
+
+def _cones_meeting(lo: tuple[int, int, int], hi: tuple[int, int, int]) -> list[int]:
+    """Every cone that may meet the box of offsets lo..hi, a superset."""
+    cones: list[int] = []
+    for axis, (a, b) in enumerate(_MINOR_AXES):
+        for negative in (False, True):
+            d_hi = -lo[axis] if negative else hi[axis]
+            if d_hi < 0:
+                continue
+            rows = _halves_meeting(lo[a], hi[a], d_hi)
+            if not rows:
+                continue
+            face = (2 * axis + negative) * 4
+            for col in _halves_meeting(lo[b], hi[b], d_hi):
+                cones.extend(face + 2 * row + col for row in rows)
+    return cones
+
+
+# Link-cut value of a box node, below every edge key
+_BOX = (-1, -1, -1)
+
+
+class JunctionNetwork:
+    """Junction boxes added one at a time, keeping both answers current.
+
+    The network keeps the k closest pairs with their circuits, and the
+    minimum spanning tree under the (dist_sq, i, j) order of
+    get_all_pairs_sorted. After each insert, circuit_product equals
+    part1(points) and connecting_product equals part2(points) on the
+    points so far. Both are None until there are three circuits or two
+    boxes, respectively.
+
+    Boxes are indexed by a grid pyramid. Leaf cells are about three median
+    tree edges wide, and every coarser level halves the grid until at most eight cells
+    remain. A new box only searches near itself:
+    - Closest pairs: a range search out to the current k-th distance.
+    - Tree: a best-first search for the closest box, by (dist_sq, index),
+      in each of 24 cones at most 60 degrees wide. Any other box u in a
+      cone has that box w with |uw| <= |uv|, and ties fall to the lower
+      index, so the edge to u is the longest of a triangle and cannot be
+      in the tree. The search stops once every cone
+      is settled, or once the remaining cells cannot meet an open cone. An
+      exact duplicate of an earlier box only links to the first copy.
+
+    Candidates that fail the lune test against a lighter one are dropped.
+    The lightest candidate is in the new tree by the cut property, so it is
+    linked directly. Each further candidate closes a cycle, and it replaces
+    the heaviest edge on the tree path if it is lighter (cycle property).
+    Those path maxima come from a LinkCutTree in O(log n) amortized.
+
+    Circuits are kept as labelled sets over the pair graph. A new pair
+    merges the smaller circuit into the larger one. An evicted pair is
+    checked by searching from both of its ends in lockstep. If one side
+    runs out, it is split off, at a cost bounded by its circuit (at most
+    k + 1 boxes) rather than by the number of boxes.
+    """
+
+    def __init__(self, points: Iterable[tuple[int, int, int]] = (), k: int = 1000):
+        self.k = k
+        self.points: list[tuple[int, int, int]] = []
+        self.circuit_product: int | None = None
+        self.connecting_product: int | None = None
+        # The k smallest pair keys, ascending, and the graph they form
+        self._pairs: list[tuple[int, int, int]] = []
+        self._paired: dict[int, set[int]] = {}
+        # Circuit label of every box with a pair, the boxes under each label,
+        # and how many circuits there are of each size
+        self._circuit: dict[int, int] = {}
+        self._members: dict[int, set[int]] = {}
+        self._size_counts: dict[int, int] = {}
+        self._next_label = 0
+        # Spanning tree: boxes and edges are link-cut nodes, edges valued by key
+        self._links = LinkCutTree()
+        self._box_node: list[int] = []
+        self._edge_node: dict[tuple[int, int, int], int] = {}
+        # Every tree edge key, ascending
+        self._tree: list[tuple[int, int, int]] = []
+        # Grid pyramid: leaf cells hold box indices, and _coarse[l - 1] holds
+        # the occupied cells of level l, the leaf cells shifted right by l
+        self._cell = 1
+        self._leaves: dict[tuple[int, int, int], list[int]] = {}
+        self._coarse: list[set[tuple[int, int, int]]] = []
+        self._regrid_at = 1
+        for point in points:
+            self.insert(point)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def insert(self, point: tuple[int, int, int]) -> tuple[int | None, int | None]:
+        """Add a box and return (circuit_product, connecting_product)."""
+        v = len(self.points)
+        point = (int(point[0]), int(point[1]), int(point[2]))
+
+        if len(self._pairs) < self.k:
+            near = [(euclidean_distance_sq(point, q), i) for i, q in enumerate(self.points)]
+        else:
+            near = self._within(point, self._pairs[-1][0])
+        neighbours = self._cone_neighbours(point) if v else []
+
+        self.points.append(point)
+        self._box_node.append(self._links.add(_BOX))
+        self._add_to_pyramid(v)
+        self._insert_pairs(v, near)
+        self._insert_tree(v, neighbours)
+
+        sizes = self._largest_circuits(3)
+        self.circuit_product = math.prod(sizes) if len(sizes) == 3 else None
+        if self._tree:
+            _, i, j = self._tree[-1]
+            self.connecting_product = self.points[i][0] * self.points[j][0]
+        return self.circuit_product, self.connecting_product
+
+    def _insert_pairs(self, v: int, near: list[tuple[int, int]]) -> None:
+        pairs = self._pairs
+        for dist_sq, i in near:
+            key = (dist_sq, i, v)
+            if len(pairs) < self.k or key < pairs[-1]:
+                bisect.insort(pairs, key)
+                self._join(i, v)
+                if len(pairs) > self.k:
+                    _, a, b = pairs.pop()
+                    self._separate(a, b)
+
+    def _count_circuit(self, size: int, delta: int) -> None:
+        count = self._size_counts.get(size, 0) + delta
+        if count:
+            self._size_counts[size] = count
+        else:
+            del self._size_counts[size]
+
+    def _new_circuit(self, boxes: set[int]) -> int:
+        label = self._next_label
+        self._next_label += 1
+        self._members[label] = boxes
+        for x in boxes:
+            self._circuit[x] = label
+        self._count_circuit(len(boxes), 1)
+        return label
+
+    def _drop_circuit(self, label: int) -> None:
+        boxes = self._members.pop(label)
+        for x in boxes:
+            del self._circuit[x]
+        self._count_circuit(len(boxes), -1)
+
+    def _join(self, a: int, b: int) -> None:
+        self._paired.setdefault(a, set()).add(b)
+        self._paired.setdefault(b, set()).add(a)
+        keep = self._circuit.get(a)
+        if keep is None:
+            keep = self._new_circuit({a})
+        absorb = self._circuit.get(b)
+        if absorb is None:
+            absorb = self._new_circuit({b})
+        if keep == absorb:
+            return
+        members = self._members
+        if len(members[keep]) < len(members[absorb]):
+            keep, absorb = absorb, keep
+        self._count_circuit(len(members[keep]), -1)
+        moved = members[absorb]
+        self._drop_circuit(absorb)
+        for x in moved:
+            self._circuit[x] = keep
+        members[keep] |= moved
+        self._count_circuit(len(members[keep]), 1)
+
+    def _separate(self, a: int, b: int) -> None:
+        """Remove the pair a-b and split its circuit if that disconnects it."""
+        paired = self._paired
+        for x, y in ((a, b), (b, a)):
+            paired[x].discard(y)
+            if not paired[x]:
+                del paired[x]
+
+        seen = ({a}, {b})
+        queues = ([a], [b])
+        heads = [0, 0]
+        side = 0
+        while heads[side] < len(queues[side]):
+            x = queues[side][heads[side]]
+            heads[side] += 1
+            for y in paired.get(x, ()):
+                if y in seen[1 - side]:
+                    return
+                if y not in seen[side]:
+                    seen[side].add(y)
+                    queues[side].append(y)
+            side = 1 - side
+
+        # seen[side] ran out without meeting the other end: a circuit of its own
+        cut_off = seen[side]
+        label = self._circuit[a]
+        rest = self._members[label]
+        self._count_circuit(len(rest), -1)
+        rest -= cut_off
+        for x in cut_off:
+            del self._circuit[x]
+        self._count_circuit(len(rest), 1)
+        if len(cut_off) > 1:
+            self._new_circuit(cut_off)
+        if len(rest) == 1:
+            # A box left without pairs is a lone circuit, which is not tracked
+            self._drop_circuit(label)
+
+    def _largest_circuits(self, count: int) -> list[int]:
+        sizes: list[int] = []
+        for size in sorted(self._size_counts, reverse=True):
+            sizes.extend([size] * min(self._size_counts[size], count - len(sizes)))
+            if len(sizes) == count:
+                return sizes
+        lone = len(self.points) - len(self._circuit)
+        sizes.extend([1] * min(lone, count - len(sizes)))
+        return sizes
+
+    def _insert_tree(self, v: int, neighbours: list[tuple[int, int]]) -> None:
+        if not neighbours:
+            return
+        points = self.points
+        candidates: list[tuple[int, int, int]] = []
+        for dist_sq, u in sorted(neighbours):
+            key = (dist_sq, u, v)
+            # Lune test: an edge is longest on the triangle with any closer pair
+            if not any(
+                (euclidean_distance_sq(points[u], points[w]), min(u, w), max(u, w)) < key
+                for _, w, _ in candidates
+            ):
+                candidates.append(key)
+
+        self._link(candidates[0])
+        links, box_node = self._links, self._box_node
+        for key in candidates[1:]:
+            _, u, _ = key
+            heaviest = links.value[links.path_max(box_node[u], box_node[v])]
+            if key < heaviest:
+                self._cut(heaviest)
+                self._link(key)
+
+    def _link(self, key: tuple[int, int, int]) -> None:
+        _, i, j = key
+        edge = self._links.add(key)
+        self._links.link(self._box_node[i], edge)
+        self._links.link(edge, self._box_node[j])
+        self._edge_node[key] = edge
+        bisect.insort(self._tree, key)
+
+    def _cut(self, key: tuple[int, int, int]) -> None:
+        _, i, j = key
+        edge = self._edge_node.pop(key)
+        self._links.cut(self._box_node[i], edge)
+        self._links.cut(edge, self._box_node[j])
+        self._links.discard(edge)
+        del self._tree[bisect.bisect_left(self._tree, key)]
+
+    def _leaf_of(self, point: tuple[int, int, int]) -> tuple[int, int, int]:
+        cell = self._cell
+        return point[0] // cell, point[1] // cell, point[2] // cell
+
+    def _add_to_pyramid(self, v: int) -> None:
+        n = len(self.points)
+        if n >= self._regrid_at:
+            # Resize leaves to a few median tree edges whenever the box count doubles
+            if self._tree:
+                self._cell = max(1, 3 * math.isqrt(self._tree[len(self._tree) // 2][0]))
+            self._leaves = {}
+            for i, point in enumerate(self.points):
+                self._leaves.setdefault(self._leaf_of(point), []).append(i)
+            self._coarse = []
+            self._regrid_at = 2 * n
+        else:
+            x, y, z = leaf = self._leaf_of(self.points[v])
+            self._leaves.setdefault(leaf, []).append(v)
+            for level, cells in enumerate(self._coarse, 1):
+                cells.add((x >> level, y >> level, z >> level))
+        while len(self._top_cells()) > 8:
+            self._coarse.append({(x >> 1, y >> 1, z >> 1) for x, y, z in self._top_cells()})
+
+    def _top_cells(self) -> Collection[tuple[int, int, int]]:
+        return self._coarse[-1] if self._coarse else self._leaves.keys()
+
+    def _offsets(
+        self, point: tuple[int, int, int], level: int, cell: tuple[int, int, int]
+    ) -> tuple[tuple[int, int, int], tuple[int, int, int], int]:
+        """Offsets from point to the nearest and farthest corners of a cell, and its squared gap."""
+        size = self._cell << level
+        lo = (cell[0] * size - point[0], cell[1] * size - point[1], cell[2] * size - point[2])
+        hi = (lo[0] + size - 1, lo[1] + size - 1, lo[2] + size - 1)
+        gap_sq = 0
+        for axis in range(3):
+            if lo[axis] > 0:
+                gap_sq += lo[axis] * lo[axis]
+            elif hi[axis] < 0:
+                gap_sq += hi[axis] * hi[axis]
+        return lo, hi, gap_sq
+
+    def _children(self, level: int, cell: tuple[int, int, int]) -> Iterator[tuple[int, int, int]]:
+        below = self._coarse[level - 2] if level > 1 else self._leaves
+        x, y, z = 2 * cell[0], 2 * cell[1], 2 * cell[2]
+        for dx, dy, dz in _OCTANTS:
+            child = (x + dx, y + dy, z + dz)
+            if child in below:
+                yield child
 
-    pairs = get_all_pairs_sorted(points)
+    def _within(self, point: tuple[int, int, int], limit: int) -> list[tuple[int, int]]:
+        """(dist_sq, index) of every box no farther than sqrt(limit) from point."""
+        points = self.points
+        found: list[tuple[int, int]] = []
+        top = len(self._coarse)
+        stack = [(top, cell) for cell in self._top_cells()]
+        while stack:
+            level, cell = stack.pop()
+            if self._offsets(point, level, cell)[2] > limit:
+                continue
+            if level:
+                stack.extend((level - 1, child) for child in self._children(level, cell))
+                continue
+            for i in self._leaves[cell]:
+                dist_sq = euclidean_distance_sq(point, points[i])
+                if dist_sq <= limit:
+                    found.append((dist_sq, i))
+        return found
 
-    for _, i, j in pairs:
-        if uf.union(i, j):
-            if uf.num_components == 1:
-                return points[i][0] * points[j][0]
+    def _cone_neighbours(self, point: tuple[int, int, int]) -> list[tuple[int, int]]:
+        """(dist_sq, index) of the closest box in each non-empty cone around point.
 
-    return 0
+        Cells are visited nearest first and skipped once every cone they may
+        meet already has a closer box. An exact duplicate is returned alone.
+        """
+        points = self.points
+        best: list[tuple[int, int] | None] = [None] * _CONES
+        # Once every cone has a box, nothing farther than the worst of them matters
+        unsettled = _CONES
+        worst = -1
+        top = len(self._coarse)
+        heap = [(self._offsets(point, top, cell)[2], top, cell) for cell in self._top_cells()]
+        heapq.heapify(heap)
+        while heap:
+            gap_sq, level, cell = heapq.heappop(heap)
+            if not unsettled and gap_sq > worst:
+                break
+            lo, hi, _ = self._offsets(point, level, cell)
+            if not any(
+                (found := best[cone]) is None or found[0] >= gap_sq for cone in _cones_meeting(lo, hi)
+            ):
+                continue
+            if level:
+                for child in self._children(level, cell):
+                    heapq.heappush(heap, (self._offsets(point, level - 1, child)[2], level - 1, child))
+                continue
+            for i in self._leaves[cell]:
+                q = points[i]
+                offset = (q[0] - point[0], q[1] - point[1], q[2] - point[2])
+                dist_sq = offset[0] * offset[0] + offset[1] * offset[1] + offset[2] * offset[2]
+                if dist_sq == 0:
+                    # Leaves list boxes in insertion order, so this is the first copy
+                    return [(0, i)]
+                if not unsettled and dist_sq > worst:
+                    continue
+                cone = _cone_of(offset)
+                current = best[cone]
+                if current is None:
+                    unsettled -= 1
+                if current is None or (dist_sq, i) < current:
+                    best[cone] = (dist_sq, i)
+            if not unsettled:
+                worst = max(found[0] for found in best if found is not None)
+        return [found for found in best if found is not None]
 
 
 def main() -> None:
@@ -95,8 +925,7 @@ def main() -> None:
         print(f"Usage: {sys.argv[0]} <input_file>", file=sys.stderr)
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        points = parse_input(f)
+    points = parse_input(sys.argv[1])
 
     result1 = part1(points)
     print(result1)
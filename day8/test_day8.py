@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(8, Path(__file__).with_name('problem.py'))
+from day8_problem import (  # noqa: E402
+    JunctionNetwork,
+    LinkCutTree,
+    UnionFind,
+    closest_pairs,
+    euclidean_mst,
+    get_all_pairs_sorted,
+    part2,
+    smallest_pairs_blocked,
+)
+
+
+def random_points(rng: random.Random, n: int, span: int) -> list[tuple[int, int, int]]:
+    return [(rng.randint(0, span), rng.randint(0, span), rng.randint(0, span)) for _ in range(n)]
+
+
+def test_closest_pairs_matches_sort() -> None:
+    rng = random.Random(8)
+    for _ in range(100):
+        points = random_points(rng, rng.randint(0, 60), rng.choice([1, 3, 50, 100000]))
+        k = rng.randint(0, 2000)
+        assert closest_pairs(points, k) == get_all_pairs_sorted(points)[:k]
+
+
+def test_closest_pairs_flat_cloud() -> None:
+    rng = random.Random(9)
+    points = [(rng.randint(0, 1000), rng.randint(0, 1000), 0) for _ in range(300)]
+    assert closest_pairs(points, 1000) == get_all_pairs_sorted(points)[:1000]
+
+
+def test_smallest_pairs_blocked_matches_sort() -> None:
+    rng = random.Random(12)
+    for _ in range(100):
+        points = random_points(rng, rng.randint(0, 60), rng.choice([1, 3, 50, 100000]))
+        k = rng.randint(0, 2000)
+        tile = rng.choice([1, 5, 16, 512])
+        assert smallest_pairs_blocked(points, k, tile=tile) == get_all_pairs_sorted(points)[:k]
+
+
+def test_smallest_pairs_blocked_workers() -> None:
+    rng = random.Random(13)
+    points = random_points(rng, 80, 4)
+    assert smallest_pairs_blocked(points, 1000, tile=16, workers=2) == get_all_pairs_sorted(points)[:1000]
+
+
+def test_euclidean_mst_matches_kruskal() -> None:
+    rng = random.Random(10)
+    for _ in range(100):
+        points = random_points(rng, rng.randint(2, 50), rng.choice([1, 3, 50, 100000]))
+        uf = UnionFind(len(points))
+        expected = [edge for edge in get_all_pairs_sorted(points) if uf.union(edge[1], edge[2])]
+        connecting, tree = euclidean_mst(points, return_tree=True)
+        assert sorted(tree) == expected
+        assert connecting == expected[-1]
+
+
+def test_union_find_top_sizes() -> None:
+    rng = random.Random(11)
+    for _ in range(200):
+        n = rng.randint(1, 40)
+        uf = UnionFind(n, top=3)
+        xs = [rng.randrange(n) for _ in range(50)]
+        ys = [rng.randrange(n) for _ in range(50)]
+        merged = uf.union_many(xs, ys)
+        assert uf.num_components == n - merged
+        assert uf.top_sizes() == sorted(uf.get_component_sizes(), reverse=True)[:3]
+
+
+def test_link_cut_tree_path_max() -> None:
+    rng = random.Random(15)
+    for _ in range(100):
+        n = rng.randint(2, 20)
+        tree = LinkCutTree()
+        for _ in range(n):
+            tree.add(rng.random())
+        adjacent: dict[int, set[int]] = {x: set() for x in range(n)}
+
+        def path(a: int, b: int) -> list[int] | None:
+            came_from = {a: a}
+            stack = [a]
+            while stack:
+                x = stack.pop()
+                for y in adjacent[x]:
+                    if y not in came_from:
+                        came_from[y] = x
+                        stack.append(y)
+            if b not in came_from:
+                return None
+            nodes = [b]
+            while nodes[-1] != a:
+                nodes.append(came_from[nodes[-1]])
+            return nodes
+
+        for _ in range(100):
+            a, b = rng.sample(range(n), 2)
+            nodes = path(a, b)
+            if nodes is None:
+                tree.link(a, b)
+                adjacent[a].add(b)
+                adjacent[b].add(a)
+            elif len(nodes) == 2 and rng.random() < 0.3:
+                tree.cut(a, b)
+                adjacent[a].discard(b)
+                adjacent[b].discard(a)
+            else:
+                assert tree.value[tree.path_max(a, b)] == max(tree.value[x] for x in nodes)
+
+
+def test_junction_network_matches_batch() -> None:
+    rng = random.Random(14)
+    for _ in range(40):
+        span = rng.choice([1, 3, 50, 100000])
+        k = rng.choice([1, 10, 1000])
+        network = JunctionNetwork(k=k)
+        points: list[tuple[int, int, int]] = []
+        for point in random_points(rng, rng.randint(1, 40), span):
+            if points and rng.random() < 0.1:
+                point = rng.choice(points)
+            elif rng.random() < 0.05:
+                point = (rng.randint(-10**7, 10**7), rng.randint(-10**7, 10**7), 10**7)
+            points.append(point)
+            circuit_product, connecting_product = network.insert(point)
+
+            uf = UnionFind(len(points))
+            pairs = get_all_pairs_sorted(points)[:k]
+            uf.union_many([i for _, i, _ in pairs], [j for _, _, j in pairs])
+            sizes = uf.top_sizes()
+            assert circuit_product == (sizes[0] * sizes[1] * sizes[2] if len(sizes) == 3 else None)
+            assert connecting_product == (part2(points) if len(points) > 1 else None)
+
+
+def test_junction_network_far_box() -> None:
+    rng = random.Random(16)
+    points = random_points(rng, 300, 1000)
+    network = JunctionNetwork(points[:150], k=200)
+    network.insert((10**9, 10**9, 10**9))
+    points.insert(150, (10**9, 10**9, 10**9))
+    for point in points[151:]:
+        network.insert(point)
+    pairs = get_all_pairs_sorted(points)[:200]
+    uf = UnionFind(len(points))
+    uf.union_many([i for _, i, _ in pairs], [j for _, _, j in pairs])
+    sizes = uf.top_sizes()
+    assert network.circuit_product == sizes[0] * sizes[1] * sizes[2]
+    assert network.connecting_product == part2(points)
+
+
+if __name__ == "__main__":
+    test_closest_pairs_matches_sort()
+    test_closest_pairs_flat_cloud()
+    test_smallest_pairs_blocked_matches_sort()
+    test_smallest_pairs_blocked_workers()
+    test_euclidean_mst_matches_kruskal()
+    test_union_find_top_sizes()
+    test_link_cut_tree_path_max()
+    test_junction_network_matches_batch()
+    test_junction_network_far_box()
+    print("All tests passed!")
@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
 import sys
+from pathlib import Path
 from typing import List, Tuple, Set
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from loader import iter_lines  # noqa: E402
+
 
 def parse_input(filename: str) -> List[Tuple[int, int]]:
     tiles: List[Tuple[int, int]] = []
-    with open(filename, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                x, y = line.split(",")
-                tiles.append((int(x), int(y)))
+    for line in iter_lines(filename):
+        line = line.strip()
+        if line:
+            x, y = line.split(b",")
+            tiles.append((int(x), int(y)))
     return tiles
 
 
@@ -187,15 +190,23 @@ def find_largest_valid_rectangle(red_tiles: List[Tuple[int, int]]) -> int:
     return max_area
 
 
+def part1(tiles: List[Tuple[int, int]]) -> int:
+    return find_largest_rectangle(tiles)
+
+
+def part2(tiles: List[Tuple[int, int]]) -> int:
+    return find_largest_valid_rectangle(tiles)
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print("Usage: python problem.py <input_file>")
         sys.exit(1)
 
     tiles = parse_input(sys.argv[1])
-    result1 = find_largest_rectangle(tiles)
+    result1 = part1(tiles)
     print(result1)
-    result2 = find_largest_valid_rectangle(tiles)
+    result2 = part2(tiles)
     print(result2)
 
 
@@ -1,7 +1,14 @@
 #!/usr/bin/env python3
 import tempfile
 import os
-from problem import (
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import load_day  # noqa: E402
+
+load_day(9, Path(__file__).with_name('problem.py'))
+from day9_problem import (  # noqa: E402
     parse_input,
     find_largest_rectangle,
     find_largest_valid_rectangle,
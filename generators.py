@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Seeded synthetic inputs for every day, sized by a single integer n."""
+import random
+import string
+from typing import Callable
+
+
+def day1(n: int, rng: random.Random) -> str:
+    """n dial rotations."""
+    return '\n'.join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(n)) + '\n'
+
+
+def day2(n: int, rng: random.Random) -> str:
+    """n comma-separated ID ranges."""
+    ranges: list[str] = []
+    for _ in range(n):
+        digits = rng.randint(2, 10)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        end = start + rng.randint(0, 10 ** min(digits - 1, 5))
+        ranges.append(f"{start}-{end}")
+    return ','.join(ranges) + '\n'
+
+
+def day3(n: int, rng: random.Random) -> str:
+    """n battery banks of 100 digits."""
+    return '\n'.join(''.join(rng.choice('123456789') for _ in range(100)) for _ in range(n)) + '\n'
+
+
+def day4(n: int, rng: random.Random) -> str:
+    """Square warehouse map with about n cells."""
+    side = max(1, int(n ** 0.5))
+    return '\n'.join(
+        ''.join('@' if rng.random() < 0.6 else '.' for _ in range(side)) for _ in range(side)
+    ) + '\n'
+
+
+def day5(n: int, rng: random.Random) -> str:
+    """n fresh ranges followed by n ingredient IDs."""
+    limit = 10 ** 14
+    lines: list[str] = []
+    for _ in range(n):
+        start = rng.randint(1, limit)
+        lines.append(f"{start}-{start + rng.randint(0, limit // n)}")
+    lines.append('')
+    lines.extend(str(rng.randint(1, limit)) for _ in range(n))
+    return '\n'.join(lines) + '\n'
+
+
+def day6(n: int, rng: random.Random) -> str:
+    """Worksheet with n problems of four numbers each."""
+    height = 4
+    rows: list[list[str]] = [[] for _ in range(height + 1)]
+    for p in range(n):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(height)]
+        width = max(len(num) for num in numbers)
+        right = rng.random() < 0.5
+        for row, num in enumerate(numbers):
+            rows[row].append(num.rjust(width) if right else num.ljust(width))
+        rows[height].append(rng.choice('+*').ljust(width))
+    return '\n'.join(' '.join(row) for row in rows) + '\n'
+
+
+def day7(n: int, rng: random.Random) -> str:
+    """Square tachyon manifold with about n cells and splitters on every other row."""
+    side = max(3, int(n ** 0.5))
+    grid = [['.'] * side for _ in range(side)]
+    grid[0][side // 2] = 'S'
+    for row in range(2, side, 2):
+        for col in range(1, side - 1):
+            if rng.random() < 0.3:
+                grid[row][col] = '^'
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+def day8(n: int, rng: random.Random) -> str:
+    """n junction boxes in a 100000-unit cube, split between separated clusters.
+
+    Each cluster fills an eighth of the side of its own grid cell, so every
+    pair inside a cluster is shorter than any pair across clusters. Part 1
+    needs three circuits after 1000 connections, which holds once the
+    clusters contain 1000 pairs, from n = 79 up.
+    """
+    clusters = max(3, n // 100)
+    per_axis = 1
+    while per_axis ** 3 < clusters:
+        per_axis += 1
+    cell = 100000 // per_axis
+    side = cell // 8
+    grid = [(x, y, z) for x in range(per_axis) for y in range(per_axis) for z in range(per_axis)]
+    corners = [(x * cell, y * cell, z * cell) for x, y, z in rng.sample(grid, clusters)]
+    boxes: list[str] = []
+    for i in range(n):
+        x, y, z = corners[i % clusters]
+        boxes.append(f"{x + rng.randint(0, side)},{y + rng.randint(0, side)},{z + rng.randint(0, side)}")
+    return '\n'.join(boxes) + '\n'
+
+
+def day9(n: int, rng: random.Random) -> str:
+    """Rectilinear histogram polygon with about n red tiles."""
+    columns = max(2, n // 2 - 1)
+    xs = sorted(rng.sample(range(1, 100000), columns + 1))
+    heights: list[int] = []
+    for _ in range(columns):
+        height = rng.randint(1, 99999)
+        while heights and height == heights[-1]:
+            height = rng.randint(1, 99999)
+        heights.append(height)
+
+    tiles = [(xs[0], 0)]
+    for i, height in enumerate(heights):
+        tiles.append((xs[i], height))
+        tiles.append((xs[i + 1], height))
+    tiles.append((xs[-1], 0))
+    return '\n'.join(f"{x},{y}" for x, y in tiles) + '\n'
+
+
+def day10(n: int, rng: random.Random) -> str:
+    """n machines with independent buttons so both parts have a unique solution."""
+    lines: list[str] = []
+    for _ in range(n):
+        lights = rng.randint(4, 8)
+        buttons = [
+            sorted({i} | {j for j in range(i + 1, lights) if rng.random() < 0.3})
+            for i in range(lights)
+        ]
+        rng.shuffle(buttons)
+        presses = [rng.randint(0, 20) for _ in buttons]
+        joltage = [0] * lights
+        target = [False] * lights
+        for button, count in zip(buttons, presses):
+            toggled = rng.random() < 0.5
+            for light in button:
+                joltage[light] += count
+                target[light] ^= toggled
+        lines.append(
+            '[' + ''.join('#' if t else '.' for t in target) + '] '
+            + ' '.join('(' + ','.join(map(str, b)) + ')' for b in buttons)
+            + ' {' + ','.join(map(str, joltage)) + '}'
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def day11(n: int, rng: random.Random) -> str:
+    """Random DAG on n devices containing you, svr, dac, fft and out."""
+    reserved = ['svr', 'you', 'dac', 'fft', 'out']
+    names: set[str] = set(reserved)
+    while len(names) < max(n, len(reserved)):
+        names.add(''.join(rng.choice(string.ascii_lowercase) for _ in range(3)))
+    middle = sorted(names - set(reserved))
+    rng.shuffle(middle)
+
+    third = len(middle) // 3
+    order = (['svr', 'you'] + middle[:third] + ['dac'] + middle[third:2 * third]
+             + ['fft'] + middle[2 * third:] + ['out'])
+    lines: list[str] = []
+    for i, name in enumerate(order[:-1]):
+        window = order[i + 1:i + 20]
+        targets = rng.sample(window, min(len(window), rng.randint(1, 3)))
+        lines.append(f"{name}: {' '.join(targets)}")
+    return '\n'.join(lines) + '\n'
+
+
+def day12(n: int, rng: random.Random) -> str:
+    """Six 3x3 presents followed by n regions."""
+    blocks: list[str] = []
+    for shape_id in range(6):
+        cells = [['#' if rng.random() < 0.7 else '.' for _ in range(3)] for _ in range(3)]
+        cells[1][1] = '#'
+        blocks.append(f"{shape_id}:\n" + '\n'.join(''.join(row) for row in cells))
+    regions: list[str] = []
+    for _ in range(n):
+        width, height = rng.randint(10, 50), rng.randint(10, 50)
+        counts = ' '.join(str(rng.randint(0, width * height // 54)) for _ in range(6))
+        regions.append(f"{width}x{height}: {counts}")
+    return '\n\n'.join(blocks) + '\n\n' + '\n'.join(regions) + '\n'
+
+
+GENERATORS: dict[int, Callable[[int, random.Random], str]] = {
+    1: day1,
+    2: day2,
+    3: day3,
+    4: day4,
+    5: day5,
+    6: day6,
+    7: day7,
+    8: day8,
+    9: day9,
+    10: day10,
+    11: day11,
+    12: day12,
+}
+
+
+def generate(day: int, n: int, seed: int = 0) -> str:
+    """Generate the input text for a day at size n, reproducible for a given seed."""
+    return GENERATORS[day](n, random.Random(f"{day}:{n}:{seed}"))
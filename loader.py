@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Memory-mapped input loading shared by the day solutions.
+
+The file is mapped read-only instead of read into a str, so parsers walk the
+page cache directly and never hold the whole text plus a list of its lines.
+"""
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def mapped(filename: str) -> Iterator[memoryview]:
+    """Yield a zero-copy memoryview over the file's bytes.
+
+    The view and any slices of it are only valid inside the with block.
+    """
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b'')
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+def iter_lines(filename: str) -> Iterator[bytes]:
+    """Lazily yield each line of the file as bytes, without its line ending.
+
+    Only the current line is copied out of the mapping.
+    """
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0
+            while pos < size:
+                end = mm.find(b'\n', pos)
+                if end == -1:
+                    end = size
+                line = mm[pos:end]
+                pos = end + 1
+                yield line[:-1] if line.endswith(b'\r') else line
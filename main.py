@@ -1,5 +1,180 @@
-def main():
-    print("Hello from aoc2025!")
+#!/usr/bin/env python3
+import argparse
+import importlib.util
+import inspect
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+
+ROOT = Path(__file__).resolve().parent
+DAY_DIR_PATTERN = re.compile(r'^day(\d+)$')
+
+
+@dataclass
+class DayResult:
+    day: int
+    part1: Any = None
+    part2: Any = None
+    parse_time: float = 0.0
+    part1_time: float = 0.0
+    part2_time: float = 0.0
+    error: str = ''
+
+    @property
+    def total_time(self) -> float:
+        return self.parse_time + self.part1_time + self.part2_time
+
+
+def discover_days(root: Path = ROOT) -> dict[int, Path]:
+    """Map day number to its problem.py for every dayN directory under root."""
+    days: dict[int, Path] = {}
+    for entry in root.iterdir():
+        match = DAY_DIR_PATTERN.match(entry.name)
+        if match and (entry / 'problem.py').is_file():
+            days[int(match.group(1))] = entry / 'problem.py'
+    return dict(sorted(days.items()))
+
+
+def load_day(day: int, problem_path: Path) -> ModuleType:
+    """Import a day's problem.py under a unique module name."""
+    name = f'day{day}_problem'
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, problem_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {problem_path}")
+    module = importlib.util.module_from_spec(spec)
+    # Registered before exec so process pools inside a day can pickle its functions
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_entry_points(module: ModuleType) -> tuple[Callable[..., Any], Callable[..., Any]]:
+    for first, second in (('solve_part1', 'solve_part2'), ('part1', 'part2')):
+        if hasattr(module, first) and hasattr(module, second):
+            return getattr(module, first), getattr(module, second)
+    raise AttributeError(f"{module.__name__} has no solve_part1/solve_part2 or part1/part2")
+
+
+def first_parameter(fn: Callable[..., Any]) -> str:
+    params = list(inspect.signature(fn).parameters)
+    return params[0] if params else ''
+
+
+def parse_day(module: ModuleType, input_path: Path) -> Any:
+    """Produce whatever the day's entry points take as their first argument.
+
+    Days with a parse_input get it called on the file; the rest take the raw
+    text or its lines, matching what their own main() passes in. Days whose
+    parts both read the file by name get None, so no parse is timed or wasted.
+    """
+    part1, part2 = find_entry_points(module)
+    if first_parameter(part1) == first_parameter(part2) == 'filename':
+        return None
+
+    parse_input = getattr(module, 'parse_input', None)
+    if parse_input is not None:
+        if first_parameter(parse_input) == 'f':
+            with open(input_path) as f:
+                return parse_input(f)
+        return parse_input(str(input_path))
+
+    text = input_path.read_text()
+    param = next(iter(inspect.signature(part1).parameters.values()))
+    if param.annotation in (str, 'str'):
+        return text
+    return text.strip().split('\n')
+
+
+def call_part(fn: Callable[..., Any], input_path: Path, parsed: Any) -> Any:
+    if first_parameter(fn) == 'filename':
+        return fn(str(input_path))
+    if isinstance(parsed, tuple):
+        n_params = len(inspect.signature(fn).parameters)
+        return fn(*parsed[:n_params])
+    return fn(parsed)
+
+
+def run_day(day: int, problem_path: Path, input_path: Path) -> DayResult:
+    """Run one day's parse, part 1 and part 2 phases, timing each."""
+    result = DayResult(day)
+    try:
+        module = load_day(day, problem_path)
+        part1, part2 = find_entry_points(module)
+
+        start = time.perf_counter()
+        parsed = parse_day(module, input_path)
+        result.parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result.part1 = call_part(part1, input_path, parsed)
+        result.part1_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result.part2 = call_part(part2, input_path, parsed)
+        result.part2_time = time.perf_counter() - start
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def format_table(results: list[DayResult], wall_time: float) -> str:
+    header = f"{'Day':>3}  {'Part 1':>20}  {'Part 2':>20}  {'Parse':>9}  {'Part 1':>9}  {'Part 2':>9}  {'Total':>9}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        if r.error:
+            lines.append(f"{r.day:>3}  {r.error}")
+            continue
+        lines.append(
+            f"{r.day:>3}  {str(r.part1):>20}  {str(r.part2):>20}  "
+            f"{r.parse_time * 1000:>7.1f}ms  {r.part1_time * 1000:>7.1f}ms  "
+            f"{r.part2_time * 1000:>7.1f}ms  {r.total_time * 1000:>7.1f}ms"
+        )
+    lines.append('-' * len(header))
+    cpu_time = sum(r.total_time for r in results)
+    lines.append(f"Wall time {wall_time:.2f}s, summed day time {cpu_time:.2f}s")
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run Advent of Code 2025 solutions in parallel.")
+    parser.add_argument('days', nargs='*', type=int, help="days to run (default: all)")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('-i', '--input', default='input.txt',
+                        help="input file name inside each day directory")
+    args = parser.parse_args()
+
+    available = discover_days()
+    selected = args.days or list(available)
+    missing = [d for d in selected if d not in available]
+    if missing:
+        print(f"Unknown day(s): {', '.join(map(str, missing))}", file=sys.stderr)
+        sys.exit(1)
+
+    results: list[DayResult] = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [
+            pool.submit(run_day, day, available[day], available[day].parent / args.input)
+            for day in selected
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+    wall_time = time.perf_counter() - start
+
+    results.sort(key=lambda r: r.day)
+    print(format_table(results, wall_time))
+    if any(r.error for r in results):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
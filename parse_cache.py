@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Content-addressed cache of parsed puzzle inputs.
+
+Parsed structures are keyed by the SHA-256 of the input file, the parser's
+day and name, and a version the parser bumps whenever its output changes.
+Hits are served from memory within a process and from pickles on disk across
+runs, so a file is tokenized at most once per parser version.
+
+The disk cache keeps the most recently used pickles within
+AOC_CACHE_MAX_BYTES (256 MiB by default) and evicts the oldest beyond that.
+Set AOC_PARSE_CACHE=0 to disable the cache and AOC_CACHE_DIR to move it.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from loader import mapped
+
+
+T = TypeVar('T')
+
+CACHE_DIR = Path(os.environ.get('AOC_CACHE_DIR', Path(__file__).resolve().parent / '.aoc_cache'))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_memory: dict[str, Any] = {}
+
+
+def enabled() -> bool:
+    return os.environ.get('AOC_PARSE_CACHE', '1') != '0'
+
+
+def max_bytes() -> int:
+    return int(os.environ.get('AOC_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+
+
+def file_digest(filename: str) -> str:
+    with mapped(filename) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(parser: Callable[..., Any], version: int, filename: str) -> str:
+    day = Path(parser.__code__.co_filename).resolve().parent.name
+    return f"{day}-{parser.__qualname__}-v{version}-{file_digest(filename)}"
+
+
+def _load(path: Path) -> Any:
+    with open(path, 'rb') as f:
+        value = pickle.load(f)
+    # Mark the hit as recent so pruning evicts colder entries first
+    os.utime(path)
+    return value
+
+
+def _store(path: Path, value: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    prune(path.parent, max_bytes())
+
+
+def prune(directory: Path, limit: int) -> None:
+    """Delete the least recently used pickles until the rest fit in limit bytes."""
+    entries: list[tuple[float, int, Path]] = []
+    for path in directory.glob('*.pickle'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+
+
+def cached_parser(version: int) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    """Cache a parser that takes an input filename.
+
+    Callers share the returned object, so parsed values must be treated as
+    read-only.
+    """
+    def decorate(parser: Callable[[str], T]) -> Callable[[str], T]:
+        @functools.wraps(parser)
+        def wrapper(filename: str) -> T:
+            if not enabled():
+                return parser(filename)
+
+            key = cache_key(parser, version, filename)
+            if key in _memory:
+                return _memory[key]
+
+            path = CACHE_DIR / f"{key}.pickle"
+            try:
+                value = _load(path)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                value = parser(filename)
+                try:
+                    _store(path, value)
+                except OSError:
+                    pass
+            _memory[key] = value
+            return value
+
+        return wrapper
+
+    return decorate
+
+
+def clear_memory() -> None:
+    _memory.clear()
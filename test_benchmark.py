@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import json
+from benchmark import MIN_SIZES, DayBenchmark, Sample, compare, fit_exponent, to_json
+from generators import generate
+from main import ROOT, load_day
+
+
+def day_result(exponent: float, totals: dict[int, float]) -> dict:
+    return {
+        'exponent': exponent,
+        'samples': [{'size': size, 'total': total} for size, total in totals.items()],
+    }
+
+
+def test_fit_exponent() -> None:
+    sizes = [100, 200, 400, 800]
+    assert abs(fit_exponent(sizes, [s * 1e-6 for s in sizes]) - 1) < 1e-9
+    assert abs(fit_exponent(sizes, [s * s * 1e-9 for s in sizes]) - 2) < 1e-9
+    assert fit_exponent([100], [1.0]) == 0.0
+    # Zero timings are clamped instead of failing the log
+    assert fit_exponent([100, 200], [0.0, 0.0]) == 0.0
+
+
+def test_compare_flags_regressions() -> None:
+    baseline = {
+        '1': day_result(1.0, {100: 0.010, 200: 0.020}),
+        '2': day_result(1.0, {100: 0.010}),
+    }
+    results = {
+        # Steeper scaling and a slow large input
+        '1': day_result(1.5, {100: 0.010, 200: 0.050}),
+        # Within both limits
+        '2': day_result(1.2, {100: 0.019}),
+        # No baseline to compare against
+        '3': day_result(3.0, {100: 9.0}),
+    }
+    regressions = compare(results, baseline, exponent_tolerance=0.3, time_ratio=2.0)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("day 1: scaling exponent 1.50")
+    assert regressions[1].startswith("day 1: n=200 took 50.0ms")
+    assert compare(results, baseline, exponent_tolerance=1.0, time_ratio=3.0) == []
+
+
+def test_compare_ignores_new_sizes() -> None:
+    baseline = {'1': day_result(1.0, {100: 0.010})}
+    results = {'1': day_result(1.0, {100: 0.010, 400: 10.0})}
+    assert compare(results, baseline, exponent_tolerance=0.3, time_ratio=2.0) == []
+
+
+def test_json_round_trip() -> None:
+    bench = DayBenchmark(4, [Sample(10, 0.001, 0.002, 0.003)], exponent=1.25)
+    results = json.loads(json.dumps(to_json([bench])))
+    assert results['4']['exponent'] == 1.25
+    assert abs(results['4']['samples'][0]['total'] - 0.006) < 1e-12
+    assert compare(results, results, exponent_tolerance=0.0, time_ratio=1.0) == []
+
+
+def test_day8_inputs_leave_three_circuits() -> None:
+    day8 = load_day(8, ROOT / 'day8' / 'problem.py')
+    for n in (MIN_SIZES[8], 100, 150, 256, 300, 1024):
+        points = [tuple(map(int, line.split(','))) for line in generate(8, n).split()]
+        pairs = day8.closest_pairs(points, 1000)
+        circuits = day8.UnionFind(n)
+        circuits.union_many([i for _, i, _ in pairs], [j for _, _, j in pairs])
+        assert len(circuits.top_sizes()) >= 3, n
+
+
+if __name__ == "__main__":
+    test_fit_exponent()
+    test_compare_flags_regressions()
+    test_compare_ignores_new_sizes()
+    test_json_round_trip()
+    test_day8_inputs_leave_three_circuits()
+    print("All tests passed!")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+from loader import iter_lines, mapped
+
+
+def write_temp(data: bytes) -> str:
+    with tempfile.NamedTemporaryFile('wb', suffix=".txt", delete=False) as f:
+        f.write(data)
+        return f.name
+
+
+def read_both(data: bytes) -> tuple[bytes, list[bytes]]:
+    path = write_temp(data)
+    try:
+        with mapped(path) as view:
+            content = bytes(view)
+        return content, list(iter_lines(path))
+    finally:
+        os.unlink(path)
+
+
+def test_mapped_is_the_whole_file() -> None:
+    data = bytes(range(256)) * 100
+    assert read_both(data)[0] == data
+
+
+def test_empty_file() -> None:
+    assert read_both(b"") == (b"", [])
+
+
+def test_line_endings() -> None:
+    assert read_both(b"ab\ncd\n")[1] == [b"ab", b"cd"]
+    assert read_both(b"ab\r\ncd\r\n")[1] == [b"ab", b"cd"]
+    assert read_both(b"\n")[1] == [b""]
+    assert read_both(b"ab\n\ncd\n")[1] == [b"ab", b"", b"cd"]
+    # Only a carriage return right before the line ending is stripped
+    assert read_both(b"a\rb\r\n")[1] == [b"a\rb"]
+
+
+def test_no_trailing_newline() -> None:
+    assert read_both(b"ab\ncd")[1] == [b"ab", b"cd"]
+    assert read_both(b"ab\r\ncd\r")[1] == [b"ab", b"cd"]
+    assert read_both(b"x")[1] == [b"x"]
+
+
+if __name__ == "__main__":
+    test_mapped_is_the_whole_file()
+    test_empty_file()
+    test_line_endings()
+    test_no_trailing_newline()
+    print("All tests passed!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import TextIO
+
+from main import call_part, discover_days, find_entry_points, parse_day
+
+
+def make_module(**functions) -> ModuleType:
+    module = ModuleType('fake_day')
+    for name, fn in functions.items():
+        setattr(module, name, fn)
+    return module
+
+
+def from_file(f: TextIO) -> list[str]:
+    return f.read().split()
+
+
+def from_filename(filename: str) -> str:
+    return filename
+
+
+def on_text(data: str) -> int:
+    return len(data)
+
+
+def on_lines(lines: list[str]) -> int:
+    return len(lines)
+
+
+def two_args(a: int, b: int) -> int:
+    return a + b
+
+
+def must_not_parse(filename: str) -> str:
+    raise AssertionError("parts that read the file themselves need no parse")
+
+
+def test_parse_day() -> None:
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+        f.write("1 2\n3 4\n")
+    path = Path(f.name)
+    # parse_input(f) gets an open file, any other parse_input the path
+    by_file = parse_day(make_module(parse_input=from_file, part1=on_lines, part2=on_lines), path)
+    by_name = parse_day(make_module(parse_input=from_filename, part1=on_lines, part2=on_lines), path)
+    # Without one, a str annotation asks for the raw text and anything else for lines
+    text = parse_day(make_module(part1=on_text, part2=on_text), path)
+    lines = parse_day(make_module(solve_part1=on_lines, solve_part2=on_lines), path)
+    skipped = parse_day(
+        make_module(parse_input=must_not_parse, solve_part1=from_filename, solve_part2=from_filename), path)
+    os.unlink(path)
+    assert by_file == ['1', '2', '3', '4']
+    assert by_name == str(path)
+    assert text == "1 2\n3 4\n"
+    assert lines == ["1 2", "3 4"]
+    assert skipped is None
+
+
+def test_call_part() -> None:
+    path = Path("input.txt")
+    assert call_part(from_filename, path, None) == "input.txt"
+    assert call_part(two_args, path, (1, 2, 3)) == 3
+    assert call_part(on_lines, path, [1, 2]) == 2
+
+
+def test_entry_points() -> None:
+    assert find_entry_points(make_module(solve_part1=on_text, solve_part2=on_lines)) == (on_text, on_lines)
+    assert find_entry_points(make_module(part1=on_text, part2=on_lines)) == (on_text, on_lines)
+    try:
+        find_entry_points(make_module(part1=on_text))
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("a module without both parts should be rejected")
+
+
+def test_discover_days() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name in ('day10', 'day2', 'dayx', 'notes'):
+            (root / name).mkdir()
+            (root / name / 'problem.py').touch()
+        (root / 'day3').mkdir()
+        days = discover_days(root)
+        assert days == {2: root / 'day2' / 'problem.py', 10: root / 'day10' / 'problem.py'}
+
+
+if __name__ == "__main__":
+    test_parse_day()
+    test_call_part()
+    test_entry_points()
+    test_discover_days()
+    print("All tests passed!")
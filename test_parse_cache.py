@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+from pathlib import Path
+
+import parse_cache
+from parse_cache import cached_parser, clear_memory, prune
+
+
+calls: list[str] = []
+
+
+def count_lines(filename: str) -> int:
+    calls.append(filename)
+    return len(Path(filename).read_text().splitlines())
+
+
+def test_hits_across_processes() -> None:
+    saved_dir = parse_cache.CACHE_DIR
+    saved_env = os.environ.pop('AOC_PARSE_CACHE', None)
+    with tempfile.TemporaryDirectory() as tmp:
+        parse_cache.CACHE_DIR = Path(tmp) / 'cache'
+        path = os.path.join(tmp, 'input.txt')
+        Path(path).write_text("a\nb\n")
+        calls.clear()
+        clear_memory()
+        parser = cached_parser(version=1)(count_lines)
+        try:
+            first, second = parser(path), parser(path)
+            # A fresh process only has the pickle on disk
+            clear_memory()
+            third = parser(path)
+            pickles = list(parse_cache.CACHE_DIR.glob('*.pickle'))
+        finally:
+            parse_cache.CACHE_DIR = saved_dir
+            if saved_env is not None:
+                os.environ['AOC_PARSE_CACHE'] = saved_env
+            clear_memory()
+    assert first == second == third == 2
+    assert len(calls) == 1
+    assert len(pickles) == 1
+
+
+def test_version_and_content_invalidate() -> None:
+    saved_dir = parse_cache.CACHE_DIR
+    saved_env = os.environ.pop('AOC_PARSE_CACHE', None)
+    with tempfile.TemporaryDirectory() as tmp:
+        parse_cache.CACHE_DIR = Path(tmp) / 'cache'
+        path = os.path.join(tmp, 'input.txt')
+        Path(path).write_text("a\nb\n")
+        calls.clear()
+        clear_memory()
+        try:
+            assert cached_parser(version=1)(count_lines)(path) == 2
+            assert cached_parser(version=2)(count_lines)(path) == 2
+            assert len(calls) == 2
+            Path(path).write_text("a\nb\nc\n")
+            assert cached_parser(version=2)(count_lines)(path) == 3
+            assert len(calls) == 3
+        finally:
+            parse_cache.CACHE_DIR = saved_dir
+            if saved_env is not None:
+                os.environ['AOC_PARSE_CACHE'] = saved_env
+            clear_memory()
+
+
+def test_corrupt_pickle_is_reparsed() -> None:
+    saved_dir = parse_cache.CACHE_DIR
+    saved_env = os.environ.pop('AOC_PARSE_CACHE', None)
+    with tempfile.TemporaryDirectory() as tmp:
+        parse_cache.CACHE_DIR = Path(tmp) / 'cache'
+        path = os.path.join(tmp, 'input.txt')
+        Path(path).write_text("a\nb\n")
+        calls.clear()
+        clear_memory()
+        parser = cached_parser(version=1)(count_lines)
+        try:
+            parser(path)
+            (pickle_path,) = parse_cache.CACHE_DIR.glob('*.pickle')
+            for junk in (b"not a pickle", pickle_path.read_bytes()[:-1]):
+                pickle_path.write_bytes(junk)
+                clear_memory()
+                assert parser(path) == 2
+            assert len(calls) == 3
+            # The bad entry was replaced by a good one
+            clear_memory()
+            assert parser(path) == 2
+            assert len(calls) == 3
+        finally:
+            parse_cache.CACHE_DIR = saved_dir
+            if saved_env is not None:
+                os.environ['AOC_PARSE_CACHE'] = saved_env
+            clear_memory()
+
+
+def test_disabled() -> None:
+    saved_dir = parse_cache.CACHE_DIR
+    saved_env = os.environ.get('AOC_PARSE_CACHE')
+    with tempfile.TemporaryDirectory() as tmp:
+        parse_cache.CACHE_DIR = Path(tmp) / 'cache'
+        path = os.path.join(tmp, 'input.txt')
+        Path(path).write_text("a\nb\n")
+        calls.clear()
+        os.environ['AOC_PARSE_CACHE'] = '0'
+        parser = cached_parser(version=1)(count_lines)
+        try:
+            parser(path)
+            parser(path)
+            cache_written = parse_cache.CACHE_DIR.exists()
+        finally:
+            parse_cache.CACHE_DIR = saved_dir
+            if saved_env is None:
+                del os.environ['AOC_PARSE_CACHE']
+            else:
+                os.environ['AOC_PARSE_CACHE'] = saved_env
+    assert len(calls) == 2
+    assert not cache_written
+
+
+def test_prune_evicts_least_recently_used() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for age, name in enumerate(['new', 'mid', 'old']):
+            path = directory / f"{name}.pickle"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (1000 - age, 1000 - age))
+        (directory / 'other.tmp').write_bytes(b"x" * 1000)
+
+        prune(directory, 250)
+        assert sorted(p.name for p in directory.iterdir()) == ['mid.pickle', 'new.pickle', 'other.tmp']
+        prune(directory, 200)
+        assert len(list(directory.iterdir())) == 3
+        prune(directory, 0)
+        assert [p.name for p in directory.iterdir()] == ['other.tmp']
+
+
+if __name__ == "__main__":
+    test_hits_across_processes()
+    test_version_and_content_invalidate()
+    test_corrupt_pickle_is_reparsed()
+    test_disabled()
+    test_prune_evicts_least_recently_used()
+    print("All tests passed!")